@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import hashlib
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 
 from django.core.cache import cache
@@ -157,6 +158,7 @@ class CacheService:
         pass
 
     @staticmethod
+    @lru_cache(maxsize=1024)
     def make_search_key(
         marketplace_code: str,
         query: str,
@@ -167,6 +169,8 @@ class CacheService:
         """
         Generate a cache key for search results.
 
+        Keys are memoized, so repeated lookups for the same search skip hashing.
+
         Args:
             marketplace_code: The marketplace code.
             query: Search query.
@@ -177,9 +181,10 @@ class CacheService:
         Returns:
             A unique cache key for this search.
         """
-        # Create a hash of the search parameters
+        # BLAKE2b is stdlib, fast on short inputs and stable across processes;
+        # a 6-byte digest keeps the historical 12 hex character key length.
         params_str = f"{marketplace_code}:{query}:{sort}:{limit}:{offset}"
-        params_hash = hashlib.md5(params_str.encode(), usedforsecurity=False).hexdigest()[:12]
+        params_hash = hashlib.blake2b(params_str.encode(), digest_size=6).hexdigest()
         return f"{CacheKeyPrefix.SEARCH}:{marketplace_code}:{params_hash}"
 
     @staticmethod
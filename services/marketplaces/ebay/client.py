@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
 import base64
-from datetime import UTC, datetime, timedelta
-from typing import Any
+import time
+from typing import Any, Self
 
 import httpx
 
@@ -26,6 +27,28 @@ BROWSE_API_URL = "https://api.ebay.com/buy/browse/v1"
 
 # Default timeout for API requests
 DEFAULT_TIMEOUT = 30.0
+CONNECT_TIMEOUT = 5.0
+
+# Keep idle connections around long enough for back-to-back searches to reuse them
+POOL_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=100,
+    keepalive_expiry=60.0,
+)
+
+# Loading the CA bundle dominates AsyncClient construction, so the SSL context is
+# built once and shared by every client (httpx's own defaults, certifi included)
+_SSL_CONTEXT = httpx.create_ssl_context()
+
+# Treat the access token as expired this many seconds early
+TOKEN_EXPIRY_BUFFER = 60.0
+
+# Browse API price filter templates, keyed by (has min_price, has max_price)
+_PRICE_FILTERS: dict[tuple[bool, bool], str] = {
+    (True, True): "price:[{min}..{max}]",
+    (True, False): "price:[{min}..]",
+    (False, True): "price:[..{max}]",
+}
 
 # eBay marketplace IDs
 EBAY_MARKETPLACES: dict[str, str] = {
@@ -87,9 +110,20 @@ class EbayClient:
         self.marketplace_id = marketplace_id
         self.timeout = timeout
 
+        # Credentials are fixed for the client's lifetime, so encode them once
+        credentials = f"{app_id}:{cert_id}"
+        self._basic_auth_header = f"Basic {base64.b64encode(credentials.encode()).decode()}"
+        # Browse API headers that do not depend on the access token
+        self._api_headers = {
+            "X-EBAY-C-MARKETPLACE-ID": marketplace_id,
+            "Accept": "application/json",
+        }
+
         self._client: httpx.AsyncClient | None = None
         self._access_token: str | None = None
-        self._token_expires_at: datetime | None = None
+        # time.monotonic() deadline, so validity checks ignore wall-clock jumps
+        self._token_expires_at: float | None = None
+        self._token_lock = asyncio.Lock()
 
     @property
     def marketplace_code(self) -> str:
@@ -99,9 +133,22 @@ class EbayClient:
     async def _get_client(self) -> httpx.AsyncClient:
         """Get or create the HTTP client."""
         if self._client is None or self._client.is_closed:
-            self._client = httpx.AsyncClient(timeout=self.timeout)
+            self._client = httpx.AsyncClient(
+                timeout=httpx.Timeout(self.timeout, connect=CONNECT_TIMEOUT),
+                limits=POOL_LIMITS,
+                verify=_SSL_CONTEXT,
+            )
         return self._client
 
+    async def __aenter__(self) -> Self:
+        """Open the HTTP client so every request in the block shares its pool."""
+        await self._get_client()
+        return self
+
+    async def __aexit__(self, *_exc_info: object) -> None:
+        """Close the client when leaving the block."""
+        await self.close()
+
     async def close(self) -> None:
         """Close the HTTP client."""
         if self._client is not None and not self._client.is_closed:
@@ -112,8 +159,7 @@ class EbayClient:
         """Check if current access token is valid."""
         if self._access_token is None or self._token_expires_at is None:
             return False
-        # Add 60 second buffer before expiry
-        return datetime.now(UTC) < (self._token_expires_at - timedelta(seconds=60))
+        return time.monotonic() < self._token_expires_at - TOKEN_EXPIRY_BUFFER
 
     async def _get_access_token(self) -> Result[str, MarketplaceError]:
         """
@@ -125,21 +171,21 @@ class EbayClient:
         if self._is_token_valid() and self._access_token is not None:
             return success(self._access_token)
 
-        return await self._fetch_new_token()
+        async with self._token_lock:
+            # Another caller may have fetched a token while we waited for the lock
+            if self._is_token_valid() and self._access_token is not None:
+                return success(self._access_token)
+            return await self._fetch_new_token()
 
     async def _fetch_new_token(self) -> Result[str, MarketplaceError]:
         """Fetch a new access token from eBay OAuth API."""
         client = await self._get_client()
 
-        # Encode credentials for Basic auth
-        credentials = f"{self.app_id}:{self.cert_id}"
-        encoded_credentials = base64.b64encode(credentials.encode()).decode()
-
         try:
             response = await client.post(
                 AUTH_URL,
                 headers={
-                    "Authorization": f"Basic {encoded_credentials}",
+                    "Authorization": self._basic_auth_header,
                     "Content-Type": "application/x-www-form-urlencoded",
                 },
                 data={
@@ -194,7 +240,7 @@ class EbayClient:
             data = response.json()
             self._access_token = data["access_token"]
             expires_in = data.get("expires_in", 7200)
-            self._token_expires_at = datetime.now(UTC) + timedelta(seconds=expires_in)
+            self._token_expires_at = time.monotonic() + expires_in
 
             logger.info("eBay access token obtained", expires_in=expires_in)
             return success(self._access_token)
@@ -238,11 +284,7 @@ class EbayClient:
                 method=method,
                 url=f"{BROWSE_API_URL}{path}",
                 params=params,
-                headers={
-                    "Authorization": f"Bearer {token}",
-                    "X-EBAY-C-MARKETPLACE-ID": self.marketplace_id,
-                    "Accept": "application/json",
-                },
+                headers={**self._api_headers, "Authorization": f"Bearer {token}"},
             )
             return self._handle_api_response(response)
         except httpx.TimeoutException:
@@ -267,6 +309,15 @@ class EbayClient:
         self, response: httpx.Response
     ) -> Result[dict[str, Any], MarketplaceError]:
         """Handle API response and convert to Result."""
+        # Successful responses are the common case, so they skip the error checks
+        if response.status_code < 400:
+            try:
+                data: dict[str, Any] = response.json()
+                return success(data)
+            except ValueError as e:
+                logger.error("Failed to parse eBay response", error=str(e))
+                return failure(ParseError(marketplace_code=self.marketplace_id))
+
         # Handle rate limiting
         if response.status_code == 429:
             retry_after = response.headers.get("Retry-After")
@@ -294,28 +345,18 @@ class EbayClient:
                 )
             )
 
-        # Handle other errors
-        if response.status_code >= 400:
-            logger.error(
-                "eBay API error",
-                marketplace_id=self.marketplace_id,
-                status_code=response.status_code,
-            )
-            return failure(
-                NetworkError(
-                    marketplace_code=self.marketplace_id,
-                    message=f"API returned status {response.status_code}",
-                    details=response.text[:500],
-                )
+        logger.error(
+            "eBay API error",
+            marketplace_id=self.marketplace_id,
+            status_code=response.status_code,
+        )
+        return failure(
+            NetworkError(
+                marketplace_code=self.marketplace_id,
+                message=f"API returned status {response.status_code}",
+                details=response.text[:500],
             )
-
-        # Parse response
-        try:
-            data: dict[str, Any] = response.json()
-            return success(data)
-        except ValueError as e:
-            logger.error("Failed to parse eBay response", error=str(e))
-            return failure(ParseError(marketplace_code=self.marketplace_id))
+        )
 
     async def search(
         self,
@@ -353,17 +394,10 @@ class EbayClient:
         if category_id:
             params["category_ids"] = category_id
 
-        # Add price filters
-        filters = []
-        if min_price is not None:
-            filters.append(f"price:[{min_price}..]")
-        if max_price is not None:
-            filters.append(f"price:[..{max_price}]")
-        if min_price is not None and max_price is not None:
-            filters = [f"price:[{min_price}..{max_price}]"]
-
-        if filters:
-            params["filter"] = ",".join(filters)
+        # Add price filter, picked by which bounds are set
+        price_filter = _PRICE_FILTERS.get((min_price is not None, max_price is not None))
+        if price_filter is not None:
+            params["filter"] = price_filter.format(min=min_price, max=max_price)
 
         logger.info(
             "Searching eBay",
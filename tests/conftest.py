@@ -12,6 +12,8 @@ import pytest
 from django.test import Client
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from apps.accounts.models import User
 
 
@@ -21,6 +23,24 @@ def test_client() -> Client:
     return Client()
 
 
+@pytest.fixture(scope="module")
+def _module_client() -> Client:
+    """Return a Django test client shared by the module's tests."""
+    return Client()
+
+
+@pytest.fixture()
+def client(_module_client: Client) -> Iterator[Client]:
+    """
+    Return the module's shared Django test client, logged out after each test.
+
+    Logging out flushes the session the test used and drops the client's
+    cookies, so tests using this fixture need database access.
+    """
+    yield _module_client
+    _module_client.logout()
+
+
 @pytest.fixture()
 def authenticated_client(test_client: Client, user: User) -> Client:
     """Return an authenticated Django test client."""
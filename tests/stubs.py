@@ -0,0 +1,75 @@
+"""
+Lightweight test doubles shared across the test suite.
+
+Service doubles built from these stubs are created once per module or session
+and shared by every test in it. An autouse fixture next to them calls their
+``reset()`` after each test, clearing whatever the test configured or recorded.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+class AsyncStub:
+    """
+    Awaitable stand-in for a coroutine method of a real service class.
+
+    Each call hands back an already-resolved future holding ``return_value``
+    (or ``side_effect``), so awaiting it skips building a coroutine frame. It
+    records the call count plus the last arguments.
+
+    The stub is built from the real method it replaces and binds every call
+    against that method's signature. A renamed method or a call that no
+    longer matches the signature fails the test, as with ``create_autospec``.
+    """
+
+    __slots__ = ("args", "calls", "kwargs", "return_value", "side_effect", "signature")
+
+    def __init__(self, method: Callable[..., Any]) -> None:
+        """
+        Initialize the stub.
+
+        Args:
+            method: Coroutine method, looked up on the class, that this stub replaces.
+
+        Raises:
+            TypeError: If method is not a coroutine function.
+        """
+        if not inspect.iscoroutinefunction(method):
+            msg = f"{method.__qualname__} is not a coroutine function"
+            raise TypeError(msg)
+
+        # Drop ``self``: the stub is called like the bound method
+        signature = inspect.signature(method)
+        self.signature = signature.replace(parameters=list(signature.parameters.values())[1:])
+        self.return_value: Any = None
+        self.side_effect: BaseException | None = None
+        self.calls = 0
+        self.args: tuple[Any, ...] = ()
+        self.kwargs: dict[str, Any] = {}
+
+    def __call__(self, *args: Any, **kwargs: Any) -> asyncio.Future[Any]:
+        self.signature.bind(*args, **kwargs)
+        self.calls += 1
+        self.args = args
+        self.kwargs = kwargs
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        if self.side_effect is not None:
+            future.set_exception(self.side_effect)
+        else:
+            future.set_result(self.return_value)
+        return future
+
+    def reset(self) -> None:
+        """Forget recorded calls and configured results."""
+        self.return_value = None
+        self.side_effect = None
+        self.calls = 0
+        self.args = ()
+        self.kwargs = {}
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 import pytest
 from django.urls import reverse
 from rest_framework import status
@@ -10,6 +12,69 @@ from rest_framework.test import APIClient
 from apps.accounts.models import User
 from apps.chat.models import Conversation, Message
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+# Pin rollback-based isolation so no test silently falls back to table truncation.
+pytestmark = pytest.mark.django_db(transaction=False)
+
+# Any syntactically valid UUID works: it is only swapped for the real pk after reversing.
+_PK_PLACEHOLDER = "00000000-0000-0000-0000-000000000000"
+
+
+def _detail_url_builder(url_name: str) -> Callable[[object], str]:
+    """Reverse a detail route once and return a builder that fills in the pk."""
+    pattern = reverse(url_name, args=[_PK_PLACEHOLDER])
+    return lambda pk: pattern.replace(_PK_PLACEHOLDER, str(pk))
+
+
+@pytest.fixture(scope="module")
+def conversation_list_url() -> str:
+    """Resolve the conversation list URL once per module."""
+    return reverse("api:conversation-list")
+
+
+@pytest.fixture(scope="module")
+def conversation_detail_url() -> Callable[[object], str]:
+    """Build conversation detail URLs from a pattern resolved once per module."""
+    return _detail_url_builder("api:conversation-detail")
+
+
+@pytest.fixture(scope="module")
+def conversation_chat_url() -> Callable[[object], str]:
+    """Build conversation chat URLs from a pattern resolved once per module."""
+    return _detail_url_builder("api:conversation-chat")
+
+
+@pytest.fixture(scope="module")
+def conversation_clear_url() -> Callable[[object], str]:
+    """Build conversation clear URLs from a pattern resolved once per module."""
+    return _detail_url_builder("api:conversation-clear")
+
+
+@pytest.fixture(scope="module")
+def message_list_url() -> str:
+    """Resolve the message list URL once per module."""
+    return reverse("api:message-list")
+
+
+@pytest.fixture(scope="module")
+def message_detail_url() -> Callable[[object], str]:
+    """Build message detail URLs from a pattern resolved once per module."""
+    return _detail_url_builder("api:message-detail")
+
+
+@pytest.fixture(scope="module")
+def marketplaces_url() -> str:
+    """Resolve the marketplaces URL once per module."""
+    return reverse("api:marketplaces")
+
+
+@pytest.fixture(scope="module")
+def health_url() -> str:
+    """Resolve the health check URL once per module."""
+    return reverse("api:health")
+
 
 @pytest.fixture()
 def api_client() -> APIClient:
@@ -54,28 +119,47 @@ def message(conversation: Conversation) -> Message:
     )
 
 
-class TestConversationViewSet:
-    """Tests for ConversationViewSet."""
+class TestUnauthenticatedAccess:
+    """Tests for endpoints that require authentication."""
 
-    def test_list_conversations_unauthenticated(self, api_client: APIClient) -> None:
+    @pytest.mark.parametrize(
+        "url_fixture",
+        ["conversation_list_url", "message_list_url", "marketplaces_url"],
+    )
+    def test_unauthenticated_rejected(
+        self,
+        api_client: APIClient,
+        url_fixture: str,
+        request: pytest.FixtureRequest,
+    ) -> None:
         """Unauthenticated requests should be rejected."""
-        url = reverse("api:conversation-list")
-        response = api_client.get(url)
+        response = api_client.get(request.getfixturevalue(url_fixture))
 
         assert response.status_code == status.HTTP_403_FORBIDDEN
 
+
+class TestConversationViewSet:
+    """Tests for ConversationViewSet."""
+
     def test_list_conversations(
-        self, authenticated_client: APIClient, conversation: Conversation
+        self,
+        authenticated_client: APIClient,
+        conversation: Conversation,
+        conversation_list_url: str,
     ) -> None:
         """Authenticated user should see their conversations."""
-        url = reverse("api:conversation-list")
-        response = authenticated_client.get(url)
+        response = authenticated_client.get(conversation_list_url)
 
         assert response.status_code == status.HTTP_200_OK
         assert response.data["count"] == 1
         assert response.data["results"][0]["id"] == str(conversation.id)
 
-    def test_list_conversations_only_own(self, authenticated_client: APIClient, user: User) -> None:
+    def test_list_conversations_only_own(
+        self,
+        authenticated_client: APIClient,
+        user: User,
+        conversation_list_url: str,
+    ) -> None:
         """User should only see their own conversations."""
         # Create another user with a conversation
         other_user = User.objects.create_user(
@@ -85,17 +169,19 @@ class TestConversationViewSet:
         )
         Conversation.objects.create(user=other_user, title="Other's convo")
 
-        url = reverse("api:conversation-list")
-        response = authenticated_client.get(url)
+        response = authenticated_client.get(conversation_list_url)
 
         assert response.status_code == status.HTTP_200_OK
         assert response.data["count"] == 0
 
-    def test_create_conversation(self, authenticated_client: APIClient) -> None:
+    def test_create_conversation(
+        self,
+        authenticated_client: APIClient,
+        conversation_list_url: str,
+    ) -> None:
         """User should be able to create a conversation."""
-        url = reverse("api:conversation-list")
         response = authenticated_client.post(
-            url,
+            conversation_list_url,
             data={"selected_marketplaces": ["MLC", "EBAY_US"]},
             format="json",
         )
@@ -104,10 +190,13 @@ class TestConversationViewSet:
         assert response.data["selected_marketplaces"] == ["MLC", "EBAY_US"]
 
     def test_retrieve_conversation(
-        self, authenticated_client: APIClient, conversation: Conversation
+        self,
+        authenticated_client: APIClient,
+        conversation: Conversation,
+        conversation_detail_url: Callable[[object], str],
     ) -> None:
         """User should be able to retrieve their conversation."""
-        url = reverse("api:conversation-detail", args=[conversation.id])
+        url = conversation_detail_url(conversation.id)
         response = authenticated_client.get(url)
 
         assert response.status_code == status.HTTP_200_OK
@@ -115,10 +204,13 @@ class TestConversationViewSet:
         assert "messages" in response.data
 
     def test_update_conversation(
-        self, authenticated_client: APIClient, conversation: Conversation
+        self,
+        authenticated_client: APIClient,
+        conversation: Conversation,
+        conversation_detail_url: Callable[[object], str],
     ) -> None:
         """User should be able to update their conversation."""
-        url = reverse("api:conversation-detail", args=[conversation.id])
+        url = conversation_detail_url(conversation.id)
         response = authenticated_client.patch(
             url,
             data={"title": "Updated Title"},
@@ -129,10 +221,13 @@ class TestConversationViewSet:
         assert response.data["title"] == "Updated Title"
 
     def test_delete_conversation(
-        self, authenticated_client: APIClient, conversation: Conversation
+        self,
+        authenticated_client: APIClient,
+        conversation: Conversation,
+        conversation_detail_url: Callable[[object], str],
     ) -> None:
         """User should be able to delete their conversation."""
-        url = reverse("api:conversation-detail", args=[conversation.id])
+        url = conversation_detail_url(conversation.id)
         response = authenticated_client.delete(url)
 
         assert response.status_code == status.HTTP_204_NO_CONTENT
@@ -142,9 +237,14 @@ class TestConversationViewSet:
 class TestConversationChatEndpoint:
     """Tests for the chat endpoint."""
 
-    def test_chat_unauthenticated(self, api_client: APIClient, conversation: Conversation) -> None:
+    def test_chat_unauthenticated(
+        self,
+        api_client: APIClient,
+        conversation: Conversation,
+        conversation_chat_url: Callable[[object], str],
+    ) -> None:
         """Unauthenticated chat should be rejected."""
-        url = reverse("api:conversation-chat", args=[conversation.id])
+        url = conversation_chat_url(conversation.id)
         response = api_client.post(
             url,
             data={"content": "Hello"},
@@ -154,7 +254,10 @@ class TestConversationChatEndpoint:
         assert response.status_code == status.HTTP_403_FORBIDDEN
 
     def test_chat_success(
-        self, authenticated_client: APIClient, conversation: Conversation
+        self,
+        authenticated_client: APIClient,
+        conversation: Conversation,
+        conversation_chat_url: Callable[[object], str],
     ) -> None:
         """Chat should create messages and return response."""
         from unittest.mock import patch
@@ -163,7 +266,7 @@ class TestConversationChatEndpoint:
 
         mock_response = ChatResponse(message="Found laptops for you!")
 
-        url = reverse("api:conversation-chat", args=[conversation.id])
+        url = conversation_chat_url(conversation.id)
         with patch(
             "apps.api.views.ConversationViewSet._invoke_chat_service",
             return_value=mock_response,
@@ -180,7 +283,12 @@ class TestConversationChatEndpoint:
         # Should have created 2 messages (user + assistant)
         assert conversation.messages.count() == 2
 
-    def test_chat_updates_title(self, authenticated_client: APIClient, user: User) -> None:
+    def test_chat_updates_title(
+        self,
+        authenticated_client: APIClient,
+        user: User,
+        conversation_chat_url: Callable[[object], str],
+    ) -> None:
         """First message should update conversation title."""
         from unittest.mock import patch
 
@@ -189,7 +297,7 @@ class TestConversationChatEndpoint:
         mock_response = ChatResponse(message="Found laptops!")
 
         convo = Conversation.objects.create(user=user, title="")
-        url = reverse("api:conversation-chat", args=[convo.id])
+        url = conversation_chat_url(convo.id)
         with patch(
             "apps.api.views.ConversationViewSet._invoke_chat_service",
             return_value=mock_response,
@@ -205,7 +313,10 @@ class TestConversationChatEndpoint:
         assert convo.title == "Find me a gaming laptop"
 
     def test_chat_updates_marketplaces(
-        self, authenticated_client: APIClient, conversation: Conversation
+        self,
+        authenticated_client: APIClient,
+        conversation: Conversation,
+        conversation_chat_url: Callable[[object], str],
     ) -> None:
         """Chat should update conversation marketplaces if provided."""
         from unittest.mock import patch
@@ -214,7 +325,7 @@ class TestConversationChatEndpoint:
 
         mock_response = ChatResponse(message="Found results!")
 
-        url = reverse("api:conversation-chat", args=[conversation.id])
+        url = conversation_chat_url(conversation.id)
         with patch(
             "apps.api.views.ConversationViewSet._invoke_chat_service",
             return_value=mock_response,
@@ -232,39 +343,34 @@ class TestConversationChatEndpoint:
         conversation.refresh_from_db()
         assert conversation.selected_marketplaces == ["EBAY_US", "EBAY_GB"]
 
-    def test_chat_invalid_content(
-        self, authenticated_client: APIClient, conversation: Conversation
-    ) -> None:
-        """Chat should reject empty content."""
-        url = reverse("api:conversation-chat", args=[conversation.id])
-        response = authenticated_client.post(
-            url,
-            data={"content": ""},
-            format="json",
-        )
-
-        assert response.status_code == status.HTTP_400_BAD_REQUEST
-
-    def test_chat_whitespace_content(
-        self, authenticated_client: APIClient, conversation: Conversation
+    @pytest.mark.parametrize("content", ["", "   ", "\t\n"], ids=["empty", "spaces", "tab_newline"])
+    def test_chat_blank_content(
+        self,
+        authenticated_client: APIClient,
+        conversation: Conversation,
+        conversation_chat_url: Callable[[object], str],
+        content: str,
     ) -> None:
-        """Chat should reject whitespace-only content."""
-        url = reverse("api:conversation-chat", args=[conversation.id])
+        """Chat should reject empty or whitespace-only content."""
+        url = conversation_chat_url(conversation.id)
         response = authenticated_client.post(
             url,
-            data={"content": "   "},
+            data={"content": content},
             format="json",
         )
 
         assert response.status_code == status.HTTP_400_BAD_REQUEST
 
     def test_chat_handles_exception(
-        self, authenticated_client: APIClient, conversation: Conversation
+        self,
+        authenticated_client: APIClient,
+        conversation: Conversation,
+        conversation_chat_url: Callable[[object], str],
     ) -> None:
         """Chat should handle processing exceptions gracefully."""
         from unittest.mock import patch
 
-        url = reverse("api:conversation-chat", args=[conversation.id])
+        url = conversation_chat_url(conversation.id)
 
         # Mock _process_chat_message to raise an exception
         with patch(
@@ -281,7 +387,10 @@ class TestConversationChatEndpoint:
         assert "error" in response.data
 
     def test_chat_with_search_results(
-        self, authenticated_client: APIClient, conversation: Conversation
+        self,
+        authenticated_client: APIClient,
+        conversation: Conversation,
+        conversation_chat_url: Callable[[object], str],
     ) -> None:
         """Chat should return search results when available."""
         from decimal import Decimal
@@ -333,7 +442,7 @@ class TestConversationChatEndpoint:
             search_intent=search_intent,
         )
 
-        url = reverse("api:conversation-chat", args=[conversation.id])
+        url = conversation_chat_url(conversation.id)
         with patch(
             "apps.api.views.ConversationViewSet._invoke_chat_service",
             return_value=mock_response,
@@ -350,7 +459,10 @@ class TestConversationChatEndpoint:
         assert len(response.data["search_results"]["products"]) == 1
 
     def test_chat_integration_with_mocked_services(
-        self, authenticated_client: APIClient, conversation: Conversation
+        self,
+        authenticated_client: APIClient,
+        conversation: Conversation,
+        conversation_chat_url: Callable[[object], str],
     ) -> None:
         """Integration test: exercise full path with mocked external services."""
         from decimal import Decimal
@@ -416,7 +528,7 @@ class TestConversationChatEndpoint:
         conversation.selected_marketplaces = ["MLC"]
         conversation.save()
 
-        url = reverse("api:conversation-chat", args=[conversation.id])
+        url = conversation_chat_url(conversation.id)
         with (
             patch("services.gemini.service.GeminiService", mock_gemini_cls),
             patch("services.search.orchestrator.SearchOrchestrator", mock_orchestrator_cls),
@@ -443,9 +555,10 @@ class TestConversationClearEndpoint:
         authenticated_client: APIClient,
         conversation: Conversation,
         message: Message,
+        conversation_clear_url: Callable[[object], str],
     ) -> None:
         """Clear should delete all messages."""
-        url = reverse("api:conversation-clear", args=[conversation.id])
+        url = conversation_clear_url(conversation.id)
         response = authenticated_client.post(url)
 
         assert response.status_code == status.HTTP_200_OK
@@ -456,12 +569,13 @@ class TestConversationClearEndpoint:
         self,
         authenticated_client: APIClient,
         conversation: Conversation,
+        conversation_clear_url: Callable[[object], str],
     ) -> None:
         """Clear should reset conversation title."""
         conversation.title = "Some Title"
         conversation.save()
 
-        url = reverse("api:conversation-clear", args=[conversation.id])
+        url = conversation_clear_url(conversation.id)
         authenticated_client.post(url)
 
         conversation.refresh_from_db()
@@ -471,38 +585,45 @@ class TestConversationClearEndpoint:
 class TestMessageViewSet:
     """Tests for MessageViewSet."""
 
-    def test_list_messages_unauthenticated(self, api_client: APIClient) -> None:
-        """Unauthenticated requests should be rejected."""
-        url = reverse("api:message-list")
-        response = api_client.get(url)
-
-        assert response.status_code == status.HTTP_403_FORBIDDEN
-
-    def test_list_messages(self, authenticated_client: APIClient, message: Message) -> None:
+    def test_list_messages(
+        self,
+        authenticated_client: APIClient,
+        message: Message,
+        message_list_url: str,
+    ) -> None:
         """Authenticated user should see their messages."""
-        url = reverse("api:message-list")
-        response = authenticated_client.get(url)
+        response = authenticated_client.get(message_list_url)
 
         assert response.status_code == status.HTTP_200_OK
         assert response.data["count"] == 1
 
-    def test_retrieve_message(self, authenticated_client: APIClient, message: Message) -> None:
+    def test_retrieve_message(
+        self,
+        authenticated_client: APIClient,
+        message: Message,
+        message_detail_url: Callable[[object], str],
+    ) -> None:
         """User should be able to retrieve their message."""
-        url = reverse("api:message-detail", args=[message.id])
+        url = message_detail_url(message.id)
         response = authenticated_client.get(url)
 
         assert response.status_code == status.HTTP_200_OK
         assert response.data["id"] == str(message.id)
 
-    def test_messages_read_only(self, authenticated_client: APIClient, message: Message) -> None:
+    def test_messages_read_only(
+        self,
+        authenticated_client: APIClient,
+        message: Message,
+        message_list_url: str,
+        message_detail_url: Callable[[object], str],
+    ) -> None:
         """Messages should be read-only (no create/update/delete via API)."""
         # Create
-        url = reverse("api:message-list")
-        response = authenticated_client.post(url, data={}, format="json")
+        response = authenticated_client.post(message_list_url, data={}, format="json")
         assert response.status_code == status.HTTP_405_METHOD_NOT_ALLOWED
 
         # Update
-        url = reverse("api:message-detail", args=[message.id])
+        url = message_detail_url(message.id)
         response = authenticated_client.patch(url, data={"content": "new"}, format="json")
         assert response.status_code == status.HTTP_405_METHOD_NOT_ALLOWED
 
@@ -514,17 +635,13 @@ class TestMessageViewSet:
 class TestMarketplacesView:
     """Tests for MarketplacesView."""
 
-    def test_list_marketplaces_unauthenticated(self, api_client: APIClient) -> None:
-        """Unauthenticated requests should be rejected."""
-        url = reverse("api:marketplaces")
-        response = api_client.get(url)
-
-        assert response.status_code == status.HTTP_403_FORBIDDEN
-
-    def test_list_marketplaces(self, authenticated_client: APIClient) -> None:
+    def test_list_marketplaces(
+        self,
+        authenticated_client: APIClient,
+        marketplaces_url: str,
+    ) -> None:
         """Authenticated user should see marketplaces."""
-        url = reverse("api:marketplaces")
-        response = authenticated_client.get(url)
+        response = authenticated_client.get(marketplaces_url)
 
         assert response.status_code == status.HTTP_200_OK
         assert len(response.data) > 0
@@ -540,10 +657,13 @@ class TestMarketplacesView:
 class TestHealthCheckView:
     """Tests for HealthCheckView."""
 
-    def test_health_check_no_auth(self, api_client: APIClient) -> None:
+    def test_health_check_no_auth(
+        self,
+        api_client: APIClient,
+        health_url: str,
+    ) -> None:
         """Health check should work without authentication."""
-        url = reverse("api:health")
-        response = api_client.get(url)
+        response = api_client.get(health_url)
 
         assert response.status_code == status.HTTP_200_OK
         assert response.data["status"] == "healthy"
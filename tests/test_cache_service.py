@@ -2,12 +2,29 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock, patch
+from typing import TYPE_CHECKING
+from unittest.mock import Mock, patch
 
 import pytest
+from django.core.cache.backends.base import BaseCache
 
 from services.cache import CacheKeyPrefix, CacheService, CacheTTL, cache_service
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+# Built once and reset between tests. Specced against BaseCache because the
+# ``django.core.cache.cache`` proxy does not expose the backend API to ``dir()``.
+_MOCK_CACHE = Mock(spec=BaseCache)
+
+
+@pytest.fixture()
+def mock_cache() -> Iterator[Mock]:
+    """Patch the Django cache used by the service with the shared mock."""
+    with patch("services.cache.cache", _MOCK_CACHE):
+        yield _MOCK_CACHE
+    _MOCK_CACHE.reset_mock(return_value=True, side_effect=True)
+
 
 class TestCacheKeyPrefix:
     """Tests for CacheKeyPrefix constants."""
@@ -43,8 +60,7 @@ class TestCacheService:
 
         assert key == "test:mykey"
 
-    @patch("services.cache.cache")
-    def test_set_and_get(self, mock_cache: MagicMock, service: CacheService) -> None:
+    def test_set_and_get(self, mock_cache: Mock, service: CacheService) -> None:
         """Should be able to set and get values."""
         mock_cache.get.return_value = "test_value"
 
@@ -55,8 +71,7 @@ class TestCacheService:
         mock_cache.set.assert_called_once()
         mock_cache.get.assert_called_once_with("test:test_key")
 
-    @patch("services.cache.cache")
-    def test_get_nonexistent(self, mock_cache: MagicMock, service: CacheService) -> None:
+    def test_get_nonexistent(self, mock_cache: Mock, service: CacheService) -> None:
         """get should return None for nonexistent key."""
         mock_cache.get.return_value = None
 
@@ -64,24 +79,21 @@ class TestCacheService:
 
         assert result is None
 
-    @patch("services.cache.cache")
-    def test_set_with_ttl(self, mock_cache: MagicMock, service: CacheService) -> None:
+    def test_set_with_ttl(self, mock_cache: Mock, service: CacheService) -> None:
         """set should accept TTL."""
         result = service.set("key_with_ttl", "value", ttl=60)
 
         assert result is True
         mock_cache.set.assert_called_once_with("test:key_with_ttl", "value", 60)
 
-    @patch("services.cache.cache")
-    def test_delete(self, mock_cache: MagicMock, service: CacheService) -> None:
+    def test_delete(self, mock_cache: Mock, service: CacheService) -> None:
         """delete should remove cached value."""
         result = service.delete("to_delete")
 
         assert result is True
         mock_cache.delete.assert_called_once_with("test:to_delete")
 
-    @patch("services.cache.cache")
-    def test_get_or_set_miss(self, mock_cache: MagicMock, service: CacheService) -> None:
+    def test_get_or_set_miss(self, mock_cache: Mock, service: CacheService) -> None:
         """get_or_set should call function on cache miss."""
         mock_cache.get.return_value = None
         call_count = 0
@@ -97,8 +109,7 @@ class TestCacheService:
         assert call_count == 1
         mock_cache.set.assert_called_once()
 
-    @patch("services.cache.cache")
-    def test_get_or_set_hit(self, mock_cache: MagicMock, service: CacheService) -> None:
+    def test_get_or_set_hit(self, mock_cache: Mock, service: CacheService) -> None:
         """get_or_set should return cached value on hit."""
         mock_cache.get.return_value = "cached_value"
         call_count = 0
@@ -113,15 +124,13 @@ class TestCacheService:
         assert result == "cached_value"
         assert call_count == 0  # Function not called
 
-    @patch("services.cache.cache")
-    def test_exists_true(self, mock_cache: MagicMock, service: CacheService) -> None:
+    def test_exists_true(self, mock_cache: Mock, service: CacheService) -> None:
         """exists should return True for existing key."""
         mock_cache.get.return_value = "some_value"
 
         assert service.exists("exists_test") is True
 
-    @patch("services.cache.cache")
-    def test_exists_false(self, mock_cache: MagicMock, service: CacheService) -> None:
+    def test_exists_false(self, mock_cache: Mock, service: CacheService) -> None:
         """exists should return False for nonexistent key."""
         mock_cache.get.return_value = None
 
@@ -167,6 +176,33 @@ class TestCacheKeyGeneration:
         # Key should start with search prefix
         assert key1.startswith(f"{CacheKeyPrefix.SEARCH}:")
 
+    def test_make_search_key_is_stable_across_processes(self) -> None:
+        """make_search_key should not depend on per-process hash randomization."""
+        key = CacheService.make_search_key(
+            marketplace_code="EBAY_US",
+            query="laptop",
+            sort="price_asc",
+            limit=20,
+            offset=0,
+        )
+
+        assert key == f"{CacheKeyPrefix.SEARCH}:EBAY_US:988672c9918e"
+
+    def test_make_search_key_is_memoized(self) -> None:
+        """make_search_key should serve repeated lookups from its LRU cache."""
+        params = {
+            "marketplace_code": "MLC",
+            "query": "memoized laptop",
+            "sort": "relevance",
+            "limit": 10,
+            "offset": 0,
+        }
+        first = CacheService.make_search_key(**params)
+        hits_before = CacheService.make_search_key.cache_info().hits
+
+        assert CacheService.make_search_key(**params) == first
+        assert CacheService.make_search_key.cache_info().hits == hits_before + 1
+
     def test_make_product_key(self) -> None:
         """make_product_key should create predictable keys."""
         key = CacheService.make_product_key("EBAY_US", "12345")
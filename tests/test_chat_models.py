@@ -2,21 +2,18 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
-
 import pytest
 
+from apps.accounts.models import User
 from apps.chat.models import Conversation, Message
 
-if TYPE_CHECKING:
-    from apps.accounts.models import User
+# Pin rollback-based isolation so no test silently falls back to table truncation.
+pytestmark = pytest.mark.django_db(transaction=False)
 
 
 @pytest.fixture()
 def user(db: None) -> User:
     """Create a test user."""
-    from apps.accounts.models import User
-
     return User.objects.create_user(
         username="testuser",
         email="test@example.com",
@@ -34,7 +31,6 @@ def conversation(user: User) -> Conversation:
     )
 
 
-@pytest.mark.django_db
 class TestConversationModel:
     """Tests for Conversation model."""
 
@@ -68,15 +64,13 @@ class TestConversationModel:
 
     def test_message_count_with_messages(self, conversation: Conversation) -> None:
         """message_count returns correct count."""
-        Message.objects.create(
-            conversation=conversation,
-            role=Message.Role.USER,
-            content="Hello",
-        )
-        Message.objects.create(
-            conversation=conversation,
-            role=Message.Role.ASSISTANT,
-            content="Hi there!",
+        Message.objects.bulk_create(
+            [
+                Message(conversation=conversation, role=Message.Role.USER, content="Hello"),
+                Message(
+                    conversation=conversation, role=Message.Role.ASSISTANT, content="Hi there!"
+                ),
+            ]
         )
 
         assert conversation.message_count == 2
@@ -88,7 +82,6 @@ class TestConversationModel:
         assert conversation.selected_marketplaces == []
 
 
-@pytest.mark.django_db
 class TestMessageModel:
     """Tests for Message model."""
 
@@ -2,15 +2,17 @@
 
 from __future__ import annotations
 
+from dataclasses import replace
 from decimal import Decimal
-from unittest.mock import AsyncMock, MagicMock
+from functools import cache
+from typing import TYPE_CHECKING, cast
 
 import pytest
 
 from core.result import failure, success
 from services.chat.service import ChatService, ChatServiceError
 from services.chat.types import ChatRequest, ChatResponse
-from services.gemini.service import GeminiError
+from services.gemini.service import GeminiError, GeminiService
 from services.gemini.types import (
     IntentType,
     RefinementIntent,
@@ -18,38 +20,36 @@ from services.gemini.types import (
 )
 from services.marketplaces.base import ProductResult, SortOrder
 from services.marketplaces.errors import ErrorCode, MarketplaceError
+from services.search.orchestrator import SearchOrchestrator
 from services.search.types import AggregatedResult, EnrichedProduct, MarketplaceSearchResult
+from tests.stubs import AsyncStub
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
 
-@pytest.fixture()
-def mock_gemini() -> MagicMock:
-    """Create a mock GeminiService."""
-    return MagicMock()
+    from core.result import Result
 
 
-@pytest.fixture()
-def mock_search() -> MagicMock:
-    """Create a mock SearchOrchestrator."""
-    return MagicMock()
+# Builders are cached so fixtures, parametrize tables and repeated in-process
+# runs share one instance of each immutable sample value.
 
 
-@pytest.fixture()
-def chat_service(mock_gemini: MagicMock, mock_search: MagicMock) -> ChatService:
-    """Create a ChatService with mocked dependencies."""
-    return ChatService(
-        gemini_service=mock_gemini,
-        search_orchestrator=mock_search,
-    )
-
-
-@pytest.fixture()
-def sample_request() -> ChatRequest:
-    """Create a sample chat request."""
+@cache
+def _make_request() -> ChatRequest:
+    """Build the sample chat request (no history)."""
     return ChatRequest(
         content="Busco un laptop gaming barato",
         conversation_id="conv-123",
         user_id="user-456",
         marketplace_codes=("MLC", "EBAY_US"),
+    )
+
+
+@cache
+def _make_request_with_history() -> ChatRequest:
+    """Build the sample chat request with a short conversation history."""
+    return replace(
+        _make_request(),
         conversation_history=(
             {"role": "user", "content": "Hola"},
             {"role": "assistant", "content": "Hola! ¿En qué puedo ayudarte?"},
@@ -57,9 +57,9 @@ def sample_request() -> ChatRequest:
     )
 
 
-@pytest.fixture()
-def sample_search_intent() -> SearchIntent:
-    """Create a sample search intent."""
+@cache
+def _make_search_intent() -> SearchIntent:
+    """Build the sample search intent (also used by parametrize tables)."""
     return SearchIntent(
         query="laptop gaming",
         original_query="Busco un laptop gaming barato",
@@ -68,9 +68,9 @@ def sample_search_intent() -> SearchIntent:
     )
 
 
-@pytest.fixture()
-def sample_product() -> ProductResult:
-    """Create a sample product result."""
+@cache
+def _make_product() -> ProductResult:
+    """Build the sample product result."""
     return ProductResult(
         id="prod-123",
         marketplace_code="EBAY_US",
@@ -87,11 +87,11 @@ def sample_product() -> ProductResult:
     )
 
 
-@pytest.fixture()
-def sample_aggregated_result(sample_product: ProductResult) -> AggregatedResult:
-    """Create a sample aggregated result."""
+@cache
+def _make_aggregated_result(*, has_more: bool = True) -> AggregatedResult:
+    """Build the sample aggregated result around the sample product."""
     enriched = EnrichedProduct(
-        product=sample_product,
+        product=_make_product(),
         marketplace_code="EBAY_US",
         marketplace_name="eBay United States",
         is_best_price=True,
@@ -105,16 +105,136 @@ def sample_aggregated_result(sample_product: ProductResult) -> AggregatedResult:
                 marketplace_name="eBay United States",
                 products=[enriched],
                 total_count=100,
-                has_more=True,
+                has_more=has_more,
             ),
         ],
         total_count=100,
         sort_order=SortOrder.PRICE_ASC,
         query="laptop gaming",
-        has_more=True,
+        has_more=has_more,
     )
 
 
+# Result wrappers are immutable, so the common ones are shared across tests.
+_SEARCH = success(IntentType.SEARCH)
+_REFINEMENT = success(IntentType.REFINEMENT)
+_MORE_RESULTS = success(IntentType.MORE_RESULTS)
+_COMPARISON = success(IntentType.COMPARISON)
+_CLARIFICATION = success(IntentType.CLARIFICATION)
+_SEARCH_INTENT = success(_make_search_intent())
+_AGGREGATED_RESULT = success(_make_aggregated_result())
+_API_ERROR = failure(GeminiError("API error"))
+_PARSE_ERROR = failure(GeminiError("Parse error"))
+
+# Lowercase phrases the Spanish responses are checked for.
+_REPHRASE = "reformularla"
+_BE_SPECIFIC = "específico"
+_TRY_AGAIN = "intenta de nuevo"
+_HELP = "ayudarte"
+_NOT_FOUND = "no encontré"
+_PROBLEMS = "problemas"
+_MORE_RESULTS_HINT = "más resultados"
+_SELECT = "selecciona"
+_NO_PREVIOUS_SEARCH = "búsqueda previa"
+_TAXES = "impuestos"
+_TAX_EXEMPT = "exento"
+
+
+class _GeminiStub:
+    """GeminiService double exposing the coroutines ChatService awaits."""
+
+    __slots__ = ("classify_intent", "extract_refinement_intent", "extract_search_intent")
+
+    def __init__(self) -> None:
+        self.classify_intent = AsyncStub(GeminiService.classify_intent)
+        self.extract_search_intent = AsyncStub(GeminiService.extract_search_intent)
+        self.extract_refinement_intent = AsyncStub(GeminiService.extract_refinement_intent)
+
+    def reset(self) -> None:
+        """Reset every stubbed coroutine."""
+        self.classify_intent.reset()
+        self.extract_search_intent.reset()
+        self.extract_refinement_intent.reset()
+
+
+class _SearchStub:
+    """SearchOrchestrator double exposing ``search`` and ``close``."""
+
+    __slots__ = ("close", "search")
+
+    def __init__(self) -> None:
+        self.search = AsyncStub(SearchOrchestrator.search)
+        self.close = AsyncStub(SearchOrchestrator.close)
+
+    def reset(self) -> None:
+        """Reset every stubbed coroutine."""
+        self.search.reset()
+        self.close.reset()
+
+
+@pytest.fixture(scope="session")
+def mock_gemini() -> _GeminiStub:
+    """Create a stub GeminiService."""
+    return _GeminiStub()
+
+
+@pytest.fixture(scope="session")
+def mock_search() -> _SearchStub:
+    """Create a stub SearchOrchestrator."""
+    return _SearchStub()
+
+
+@pytest.fixture(scope="session")
+def chat_service(mock_gemini: _GeminiStub, mock_search: _SearchStub) -> ChatService:
+    """Create a ChatService with stubbed dependencies."""
+    return ChatService(
+        gemini_service=cast("GeminiService", mock_gemini),
+        search_orchestrator=cast("SearchOrchestrator", mock_search),
+    )
+
+
+@pytest.fixture(autouse=True)
+def _reset_stubs(mock_gemini: _GeminiStub, mock_search: _SearchStub) -> Iterator[None]:
+    """Clear the shared stubs after each test."""
+    yield
+    mock_gemini.reset()
+    mock_search.reset()
+
+
+# The sample value fixtures below are session-scoped too: tests only feed them
+# to stubs and read them back, so building them once per run is safe.
+
+
+@pytest.fixture(scope="session")
+def sample_request() -> ChatRequest:
+    """Create a sample chat request."""
+    return _make_request()
+
+
+@pytest.fixture(scope="session")
+def sample_request_with_history() -> ChatRequest:
+    """Create a sample chat request carrying conversation history."""
+    return _make_request_with_history()
+
+
+@pytest.fixture(scope="session")
+def sample_search_intent() -> SearchIntent:
+    """Create a sample search intent."""
+    return _make_search_intent()
+
+
+@pytest.fixture(scope="session")
+def sample_product() -> ProductResult:
+    """Create a sample product result."""
+    return _make_product()
+
+
+@pytest.fixture(scope="session")
+def sample_aggregated_result() -> AggregatedResult:
+    """Create a sample aggregated result."""
+    return _make_aggregated_result()
+
+
 class TestChatServiceError:
     """Tests for ChatServiceError."""
 
@@ -127,34 +247,33 @@ class TestChatServiceError:
 class TestChatServiceInit:
     """Tests for ChatService initialization."""
 
-    def test_init(self, mock_gemini: MagicMock, mock_search: MagicMock) -> None:
+    def test_init(self, mock_gemini: _GeminiStub, mock_search: _SearchStub) -> None:
         """ChatService should initialize with dependencies."""
-        service = ChatService(
-            gemini_service=mock_gemini,
-            search_orchestrator=mock_search,
-        )
-        assert service._gemini is mock_gemini
-        assert service._search is mock_search
+        gemini = cast("GeminiService", mock_gemini)
+        search = cast("SearchOrchestrator", mock_search)
+        service = ChatService(gemini_service=gemini, search_orchestrator=search)
+        assert service._gemini is gemini
+        assert service._search is search
 
 
 class TestChatServiceProcess:
     """Tests for ChatService.process method."""
 
-    @pytest.mark.asyncio()
+    @pytest.mark.asyncio
     async def test_process_search_success(
         self,
         chat_service: ChatService,
-        mock_gemini: MagicMock,
-        mock_search: MagicMock,
+        mock_gemini: _GeminiStub,
+        mock_search: _SearchStub,
         sample_request: ChatRequest,
         sample_search_intent: SearchIntent,
         sample_aggregated_result: AggregatedResult,
     ) -> None:
         """Process should handle search intent successfully."""
         # Setup mocks
-        mock_gemini.classify_intent = AsyncMock(return_value=success(IntentType.SEARCH))
-        mock_gemini.extract_search_intent = AsyncMock(return_value=success(sample_search_intent))
-        mock_search.search = AsyncMock(return_value=success(sample_aggregated_result))
+        mock_gemini.classify_intent.return_value = _SEARCH
+        mock_gemini.extract_search_intent.return_value = _SEARCH_INTENT
+        mock_search.search.return_value = _AGGREGATED_RESULT
 
         # Execute
         response = await chat_service.process(sample_request)
@@ -166,72 +285,11 @@ class TestChatServiceProcess:
         assert response.search_results == sample_aggregated_result
         assert "laptop gaming" in response.message
 
-    @pytest.mark.asyncio()
-    async def test_process_classify_intent_failure(
-        self,
-        chat_service: ChatService,
-        mock_gemini: MagicMock,
-        sample_request: ChatRequest,
-    ) -> None:
-        """Process should handle intent classification failure."""
-        mock_gemini.classify_intent = AsyncMock(return_value=failure(GeminiError("API error")))
-
-        response = await chat_service.process(sample_request)
-
-        assert not response.is_success
-        assert "reformularla" in response.message
-
-    @pytest.mark.asyncio()
-    async def test_process_extract_intent_failure(
-        self,
-        chat_service: ChatService,
-        mock_gemini: MagicMock,
-        sample_request: ChatRequest,
-    ) -> None:
-        """Process should handle search intent extraction failure."""
-        mock_gemini.classify_intent = AsyncMock(return_value=success(IntentType.SEARCH))
-        mock_gemini.extract_search_intent = AsyncMock(
-            return_value=failure(GeminiError("Parse error"))
-        )
-
-        response = await chat_service.process(sample_request)
-
-        assert not response.is_success
-        assert "específico" in response.message
-
-    @pytest.mark.asyncio()
-    async def test_process_search_failure(
-        self,
-        chat_service: ChatService,
-        mock_gemini: MagicMock,
-        mock_search: MagicMock,
-        sample_request: ChatRequest,
-        sample_search_intent: SearchIntent,
-    ) -> None:
-        """Process should handle search failure."""
-        mock_gemini.classify_intent = AsyncMock(return_value=success(IntentType.SEARCH))
-        mock_gemini.extract_search_intent = AsyncMock(return_value=success(sample_search_intent))
-        mock_search.search = AsyncMock(
-            return_value=failure(
-                MarketplaceError(
-                    code=ErrorCode.NETWORK,
-                    message="Network error",
-                    marketplace_code="EBAY_US",
-                )
-            )
-        )
-
-        response = await chat_service.process(sample_request)
-
-        assert not response.is_success
-        assert "intenta de nuevo" in response.message
-
-    @pytest.mark.asyncio()
+    @pytest.mark.asyncio
     async def test_process_no_marketplaces(
         self,
         chat_service: ChatService,
-        mock_gemini: MagicMock,
-        sample_search_intent: SearchIntent,
+        mock_gemini: _GeminiStub,
     ) -> None:
         """Process should prompt for marketplace selection."""
         request = ChatRequest(
@@ -240,41 +298,223 @@ class TestChatServiceProcess:
             user_id="user-456",
             marketplace_codes=(),  # No marketplaces
         )
-        mock_gemini.classify_intent = AsyncMock(return_value=success(IntentType.SEARCH))
-        mock_gemini.extract_search_intent = AsyncMock(return_value=success(sample_search_intent))
+        mock_gemini.classify_intent.return_value = _SEARCH
+        mock_gemini.extract_search_intent.return_value = _SEARCH_INTENT
 
         response = await chat_service.process(request)
 
         assert response.is_success
-        assert "selecciona" in response.message.lower()
+        assert _SELECT in response.message.lower()
         assert response.search_results is None
 
-    @pytest.mark.asyncio()
+    @pytest.mark.asyncio
     async def test_process_exception(
         self,
         chat_service: ChatService,
-        mock_gemini: MagicMock,
-        sample_request: ChatRequest,
+        mock_gemini: _GeminiStub,
     ) -> None:
         """Process should handle unexpected exceptions."""
-        mock_gemini.classify_intent = AsyncMock(side_effect=RuntimeError("Unexpected error"))
+        mock_gemini.classify_intent.side_effect = RuntimeError("Unexpected error")
+        request = ChatRequest(content="x", conversation_id="c", user_id="u")
 
-        response = await chat_service.process(sample_request)
+        response = await chat_service.process(request)
 
         assert not response.is_success
         assert "error" in response.message.lower()
 
+    @pytest.mark.parametrize(
+        (
+            "classify",
+            "extract",
+            "search",
+            "is_success",
+            "intent_type",
+            "extract_calls",
+            "search_calls",
+            "expected",
+            "unexpected",
+        ),
+        [
+            pytest.param(
+                _API_ERROR,
+                None,
+                None,
+                False,
+                None,
+                0,
+                0,
+                (_REPHRASE,),
+                (),
+                id="classify_failure",
+            ),
+            pytest.param(
+                _SEARCH,
+                _PARSE_ERROR,
+                None,
+                False,
+                None,
+                1,
+                0,
+                (_BE_SPECIFIC,),
+                (),
+                id="extract_failure",
+            ),
+            pytest.param(
+                _SEARCH,
+                _SEARCH_INTENT,
+                failure(
+                    MarketplaceError(
+                        code=ErrorCode.NETWORK,
+                        message="Network error",
+                        marketplace_code="EBAY_US",
+                    )
+                ),
+                False,
+                None,
+                1,
+                1,
+                (_TRY_AGAIN,),
+                (),
+                id="search_failure",
+            ),
+            pytest.param(
+                _CLARIFICATION,
+                None,
+                None,
+                True,
+                IntentType.CLARIFICATION,
+                0,
+                0,
+                (_HELP,),
+                (),
+                id="clarification",
+            ),
+            pytest.param(
+                _COMPARISON,
+                _SEARCH_INTENT,
+                _AGGREGATED_RESULT,
+                True,
+                IntentType.SEARCH,
+                1,
+                1,
+                ("laptop gaming",),
+                (),
+                id="comparison_falls_back_to_search",
+            ),
+            pytest.param(
+                _SEARCH,
+                _SEARCH_INTENT,
+                success(
+                    AggregatedResult(
+                        products=[],
+                        marketplace_results=[],
+                        total_count=0,
+                        query="unicornio volador",
+                    )
+                ),
+                True,
+                IntentType.SEARCH,
+                1,
+                1,
+                (_NOT_FOUND,),
+                (),
+                id="no_results",
+            ),
+            pytest.param(
+                _SEARCH,
+                _SEARCH_INTENT,
+                success(
+                    AggregatedResult(
+                        products=[],
+                        marketplace_results=[
+                            MarketplaceSearchResult(
+                                marketplace_code="MLC",
+                                marketplace_name="MercadoLibre Chile",
+                                error="Connection timeout",
+                            ),
+                        ],
+                        total_count=0,
+                        query="laptop",
+                    )
+                ),
+                True,
+                IntentType.SEARCH,
+                1,
+                1,
+                (_PROBLEMS, "mlc"),
+                (),
+                id="failed_marketplaces",
+            ),
+            pytest.param(
+                _SEARCH,
+                _SEARCH_INTENT,
+                _AGGREGATED_RESULT,
+                True,
+                IntentType.SEARCH,
+                1,
+                1,
+                (_MORE_RESULTS_HINT,),
+                (),
+                id="has_more",
+            ),
+            pytest.param(
+                _SEARCH,
+                _SEARCH_INTENT,
+                success(_make_aggregated_result(has_more=False)),
+                True,
+                IntentType.SEARCH,
+                1,
+                1,
+                (),
+                (_MORE_RESULTS_HINT,),
+                id="no_has_more",
+            ),
+        ],
+    )
+    @pytest.mark.asyncio
+    async def test_process_matrix(
+        self,
+        chat_service: ChatService,
+        mock_gemini: _GeminiStub,
+        mock_search: _SearchStub,
+        sample_request: ChatRequest,
+        classify: Result[IntentType, GeminiError],
+        extract: Result[SearchIntent, GeminiError] | None,
+        search: Result[AggregatedResult, MarketplaceError] | None,
+        is_success: bool,
+        intent_type: IntentType | None,
+        extract_calls: int,
+        search_calls: int,
+        expected: tuple[str, ...],
+        unexpected: tuple[str, ...],
+    ) -> None:
+        """Process should map each intent/search outcome to the right response."""
+        mock_gemini.classify_intent.return_value = classify
+        mock_gemini.extract_search_intent.return_value = extract
+        mock_search.search.return_value = search
+
+        response = await chat_service.process(sample_request)
+
+        message = response.message.lower()
+        assert response.is_success is is_success
+        assert response.intent_type == intent_type
+        assert mock_gemini.extract_search_intent.calls == extract_calls
+        assert mock_search.search.calls == search_calls
+        for text in expected:
+            assert text in message
+        for text in unexpected:
+            assert text not in message
+
 
 class TestChatServiceIntents:
     """Tests for intent handling."""
 
-    @pytest.mark.asyncio()
+    @pytest.mark.asyncio
     async def test_handle_refinement(
         self,
         chat_service: ChatService,
-        mock_gemini: MagicMock,
-        mock_search: MagicMock,
-        sample_aggregated_result: AggregatedResult,
+        mock_gemini: _GeminiStub,
+        mock_search: _SearchStub,
     ) -> None:
         """Process should handle refinement intent when a previous search exists."""
         # A refinement only runs when the conversation already has a prior search;
@@ -293,51 +533,45 @@ class TestChatServiceIntents:
                 },
             ),
         )
-        mock_gemini.classify_intent = AsyncMock(return_value=success(IntentType.REFINEMENT))
-        mock_gemini.extract_refinement_intent = AsyncMock(
-            return_value=success(
-                RefinementIntent(
-                    refinement_type="filter",
-                    original_query="De esos, el más barato",
-                )
+        mock_gemini.classify_intent.return_value = _REFINEMENT
+        mock_gemini.extract_refinement_intent.return_value = success(
+            RefinementIntent(
+                refinement_type="filter",
+                original_query="De esos, el más barato",
             )
         )
-        mock_search.search = AsyncMock(return_value=success(sample_aggregated_result))
+        mock_search.search.return_value = _AGGREGATED_RESULT
 
         response = await chat_service.process(request)
 
         assert response.is_success
-        mock_gemini.extract_refinement_intent.assert_called_once()
+        assert mock_gemini.extract_refinement_intent.calls == 1
 
-    @pytest.mark.asyncio()
+    @pytest.mark.asyncio
     async def test_handle_refinement_failure_fallback(
         self,
         chat_service: ChatService,
-        mock_gemini: MagicMock,
-        mock_search: MagicMock,
+        mock_gemini: _GeminiStub,
+        mock_search: _SearchStub,
         sample_request: ChatRequest,
-        sample_search_intent: SearchIntent,
-        sample_aggregated_result: AggregatedResult,
     ) -> None:
         """Refinement failure should fall back to search."""
-        mock_gemini.classify_intent = AsyncMock(return_value=success(IntentType.REFINEMENT))
-        mock_gemini.extract_refinement_intent = AsyncMock(
-            return_value=failure(GeminiError("Parse error"))
-        )
-        mock_gemini.extract_search_intent = AsyncMock(return_value=success(sample_search_intent))
-        mock_search.search = AsyncMock(return_value=success(sample_aggregated_result))
+        mock_gemini.classify_intent.return_value = _REFINEMENT
+        mock_gemini.extract_refinement_intent.return_value = _PARSE_ERROR
+        mock_gemini.extract_search_intent.return_value = _SEARCH_INTENT
+        mock_search.search.return_value = _AGGREGATED_RESULT
 
         response = await chat_service.process(sample_request)
 
         assert response.is_success
         # Should have fallen back to search
-        mock_gemini.extract_search_intent.assert_called_once()
+        assert mock_gemini.extract_search_intent.calls == 1
 
-    @pytest.mark.asyncio()
+    @pytest.mark.asyncio
     async def test_handle_more_results_without_context(
         self,
         chat_service: ChatService,
-        mock_gemini: MagicMock,
+        mock_gemini: _GeminiStub,
     ) -> None:
         """More results without previous search should ask for search."""
         request = ChatRequest(
@@ -346,25 +580,23 @@ class TestChatServiceIntents:
             user_id="user-456",
             marketplace_codes=("MLC",),
         )
-        mock_gemini.classify_intent = AsyncMock(return_value=success(IntentType.MORE_RESULTS))
+        mock_gemini.classify_intent.return_value = _MORE_RESULTS
 
         response = await chat_service.process(request)
 
         assert response.is_success
-        assert "búsqueda previa" in response.message.lower()
+        assert _NO_PREVIOUS_SEARCH in response.message.lower()
 
-    @pytest.mark.asyncio()
+    @pytest.mark.asyncio
     async def test_handle_more_results_with_previous_search(
         self,
         chat_service: ChatService,
-        mock_gemini: MagicMock,
-        mock_search: MagicMock,
+        mock_gemini: _GeminiStub,
+        mock_search: _SearchStub,
         sample_search_intent: SearchIntent,
-        sample_aggregated_result: AggregatedResult,
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """More results with previous search should re-execute search."""
-        from unittest.mock import patch
-
         from services.gemini.types import ConversationContext
 
         request = ChatRequest(
@@ -380,180 +612,41 @@ class TestChatServiceIntents:
             last_search_intent=sample_search_intent,
         )
 
-        mock_gemini.classify_intent = AsyncMock(return_value=success(IntentType.MORE_RESULTS))
-        mock_gemini.extract_search_intent = AsyncMock(return_value=success(sample_search_intent))
-        mock_search.search = AsyncMock(return_value=success(sample_aggregated_result))
+        mock_gemini.classify_intent.return_value = _MORE_RESULTS
+        mock_gemini.extract_search_intent.return_value = _SEARCH_INTENT
+        mock_search.search.return_value = _AGGREGATED_RESULT
 
-        # Patch _build_context to return context with last_search_intent
-        with patch.object(
-            chat_service,
-            "_build_context",
-            return_value=context_with_intent,
-        ):
-            response = await chat_service.process(request)
+        # Make _build_context return the context with last_search_intent
+        monkeypatch.setattr(chat_service, "_build_context", lambda _request: context_with_intent)
 
-        assert response.is_success
-        # Should have executed search
-        mock_gemini.extract_search_intent.assert_called_once()
-
-    @pytest.mark.asyncio()
-    async def test_handle_clarification(
-        self,
-        chat_service: ChatService,
-        mock_gemini: MagicMock,
-        sample_request: ChatRequest,
-    ) -> None:
-        """Process should handle clarification intent."""
-        mock_gemini.classify_intent = AsyncMock(return_value=success(IntentType.CLARIFICATION))
-
-        response = await chat_service.process(sample_request)
-
-        assert response.is_success
-        assert response.intent_type == IntentType.CLARIFICATION
-        assert "ayudarte" in response.message.lower()
-
-    @pytest.mark.asyncio()
-    async def test_handle_comparison_fallback_to_search(
-        self,
-        chat_service: ChatService,
-        mock_gemini: MagicMock,
-        mock_search: MagicMock,
-        sample_request: ChatRequest,
-        sample_search_intent: SearchIntent,
-        sample_aggregated_result: AggregatedResult,
-    ) -> None:
-        """Comparison intent should fall back to search."""
-        mock_gemini.classify_intent = AsyncMock(return_value=success(IntentType.COMPARISON))
-        mock_gemini.extract_search_intent = AsyncMock(return_value=success(sample_search_intent))
-        mock_search.search = AsyncMock(return_value=success(sample_aggregated_result))
-
-        response = await chat_service.process(sample_request)
+        response = await chat_service.process(request)
 
         assert response.is_success
-        # Should have fallen back to search
-        mock_gemini.extract_search_intent.assert_called_once()
+        # Should have executed search
+        assert mock_gemini.extract_search_intent.calls == 1
 
 
 class TestChatServiceResponseFormatting:
     """Tests for response formatting."""
 
-    @pytest.mark.asyncio()
-    async def test_format_no_results(
-        self,
-        chat_service: ChatService,
-        mock_gemini: MagicMock,
-        mock_search: MagicMock,
-        sample_request: ChatRequest,
-        sample_search_intent: SearchIntent,
-    ) -> None:
-        """Should format message for no results."""
-        empty_result = AggregatedResult(
-            products=[],
-            marketplace_results=[],
-            total_count=0,
-            query="unicornio volador",
-        )
-        mock_gemini.classify_intent = AsyncMock(return_value=success(IntentType.SEARCH))
-        mock_gemini.extract_search_intent = AsyncMock(return_value=success(sample_search_intent))
-        mock_search.search = AsyncMock(return_value=success(empty_result))
-
-        response = await chat_service.process(sample_request)
-
-        assert response.is_success
-        assert "no encontré" in response.message.lower()
-
-    @pytest.mark.asyncio()
-    async def test_format_with_failed_marketplaces(
-        self,
-        chat_service: ChatService,
-        mock_gemini: MagicMock,
-        mock_search: MagicMock,
-        sample_request: ChatRequest,
-        sample_search_intent: SearchIntent,
-    ) -> None:
-        """Should mention failed marketplaces."""
-        result_with_failures = AggregatedResult(
-            products=[],
-            marketplace_results=[
-                MarketplaceSearchResult(
-                    marketplace_code="MLC",
-                    marketplace_name="MercadoLibre Chile",
-                    error="Connection timeout",
-                ),
-            ],
-            total_count=0,
-            query="laptop",
-        )
-        mock_gemini.classify_intent = AsyncMock(return_value=success(IntentType.SEARCH))
-        mock_gemini.extract_search_intent = AsyncMock(return_value=success(sample_search_intent))
-        mock_search.search = AsyncMock(return_value=success(result_with_failures))
-
-        response = await chat_service.process(sample_request)
-
-        assert "problemas" in response.message.lower()
-        assert "MLC" in response.message
-
-    @pytest.mark.asyncio()
-    async def test_format_with_has_more(
+    def test_build_context_with_history(
         self,
         chat_service: ChatService,
-        mock_gemini: MagicMock,
-        mock_search: MagicMock,
-        sample_request: ChatRequest,
-        sample_search_intent: SearchIntent,
-        sample_aggregated_result: AggregatedResult,
+        sample_request_with_history: ChatRequest,
     ) -> None:
-        """Should mention more results available."""
-        mock_gemini.classify_intent = AsyncMock(return_value=success(IntentType.SEARCH))
-        mock_gemini.extract_search_intent = AsyncMock(return_value=success(sample_search_intent))
-        mock_search.search = AsyncMock(return_value=success(sample_aggregated_result))
-
-        response = await chat_service.process(sample_request)
+        """Should replay user and assistant history into the context."""
+        context = chat_service._build_context(sample_request_with_history)
 
-        assert "más resultados" in response.message.lower()
+        assert context.messages == list(sample_request_with_history.conversation_history)
+        assert context.selected_marketplaces == ["MLC", "EBAY_US"]
+        assert context.last_search_intent is None
 
-    @pytest.mark.asyncio()
-    async def test_format_results_no_has_more(
-        self,
-        chat_service: ChatService,
-        mock_gemini: MagicMock,
-        mock_search: MagicMock,
-        sample_request: ChatRequest,
-        sample_search_intent: SearchIntent,
-        sample_product: ProductResult,
-    ) -> None:
-        """Should not mention more results when has_more=False."""
-        enriched = EnrichedProduct(
-            product=sample_product,
-            marketplace_code="EBAY_US",
-            marketplace_name="eBay US",
-            is_best_price=False,
-            price_rank=1,
-        )
-        result = AggregatedResult(
-            products=[enriched],
-            marketplace_results=[],
-            total_count=1,
-            query="laptop",
-            has_more=False,
-        )
-        mock_gemini.classify_intent = AsyncMock(return_value=success(IntentType.SEARCH))
-        mock_gemini.extract_search_intent = AsyncMock(return_value=success(sample_search_intent))
-        mock_search.search = AsyncMock(return_value=success(result))
-
-        response = await chat_service.process(sample_request)
-
-        assert response.is_success
-        assert "más resultados" not in response.message.lower()
-
-    @pytest.mark.asyncio()
+    @pytest.mark.asyncio
     async def test_build_context_user_only_messages(
         self,
         chat_service: ChatService,
-        mock_gemini: MagicMock,
-        mock_search: MagicMock,
-        sample_search_intent: SearchIntent,
-        sample_aggregated_result: AggregatedResult,
+        mock_gemini: _GeminiStub,
+        mock_search: _SearchStub,
     ) -> None:
         """Should handle conversation with only user messages."""
         request = ChatRequest(
@@ -563,22 +656,20 @@ class TestChatServiceResponseFormatting:
             marketplace_codes=("MLC",),
             conversation_history=({"role": "user", "content": "Previous query"},),
         )
-        mock_gemini.classify_intent = AsyncMock(return_value=success(IntentType.SEARCH))
-        mock_gemini.extract_search_intent = AsyncMock(return_value=success(sample_search_intent))
-        mock_search.search = AsyncMock(return_value=success(sample_aggregated_result))
+        mock_gemini.classify_intent.return_value = _SEARCH
+        mock_gemini.extract_search_intent.return_value = _SEARCH_INTENT
+        mock_search.search.return_value = _AGGREGATED_RESULT
 
         response = await chat_service.process(request)
 
         assert response.is_success
 
-    @pytest.mark.asyncio()
+    @pytest.mark.asyncio
     async def test_build_context_ignores_unknown_roles(
         self,
         chat_service: ChatService,
-        mock_gemini: MagicMock,
-        mock_search: MagicMock,
-        sample_search_intent: SearchIntent,
-        sample_aggregated_result: AggregatedResult,
+        mock_gemini: _GeminiStub,
+        mock_search: _SearchStub,
     ) -> None:
         """Should ignore messages with unknown roles."""
         request = ChatRequest(
@@ -591,9 +682,9 @@ class TestChatServiceResponseFormatting:
                 {"role": "user", "content": "User message"},
             ),
         )
-        mock_gemini.classify_intent = AsyncMock(return_value=success(IntentType.SEARCH))
-        mock_gemini.extract_search_intent = AsyncMock(return_value=success(sample_search_intent))
-        mock_search.search = AsyncMock(return_value=success(sample_aggregated_result))
+        mock_gemini.classify_intent.return_value = _SEARCH
+        mock_gemini.extract_search_intent.return_value = _SEARCH_INTENT
+        mock_search.search.return_value = _AGGREGATED_RESULT
 
         response = await chat_service.process(request)
 
@@ -603,13 +694,12 @@ class TestChatServiceResponseFormatting:
 class TestChatServiceTaxIntegration:
     """Tests for tax information in responses."""
 
-    @pytest.mark.asyncio()
+    @pytest.mark.asyncio
     async def test_format_best_price_with_taxes(
         self,
         chat_service: ChatService,
-        mock_gemini: MagicMock,
-        mock_search: MagicMock,
-        sample_search_intent: SearchIntent,
+        mock_gemini: _GeminiStub,
+        mock_search: _SearchStub,
         sample_product: ProductResult,
     ) -> None:
         """Should format best price with tax breakdown."""
@@ -647,25 +737,24 @@ class TestChatServiceTaxIntegration:
             marketplace_codes=("EBAY_US",),
             destination_country="CL",
         )
-        mock_gemini.classify_intent = AsyncMock(return_value=success(IntentType.SEARCH))
-        mock_gemini.extract_search_intent = AsyncMock(return_value=success(sample_search_intent))
-        mock_search.search = AsyncMock(return_value=success(result))
+        mock_gemini.classify_intent.return_value = _SEARCH
+        mock_gemini.extract_search_intent.return_value = _SEARCH_INTENT
+        mock_search.search.return_value = success(result)
 
         response = await chat_service.process(request)
 
         assert response.is_success
         # Should include tax info in best price
-        assert "impuestos" in response.message.lower()
+        assert _TAXES in response.message.lower()
         assert "249.99" in response.message  # Total taxes
         assert "1,249.98" in response.message  # Total with taxes
 
-    @pytest.mark.asyncio()
+    @pytest.mark.asyncio
     async def test_format_best_price_with_de_minimis(
         self,
         chat_service: ChatService,
-        mock_gemini: MagicMock,
-        mock_search: MagicMock,
-        sample_search_intent: SearchIntent,
+        mock_gemini: _GeminiStub,
+        mock_search: _SearchStub,
     ) -> None:
         """Should indicate de minimis exemption."""
         from services.search.types import TaxInfo
@@ -710,23 +799,21 @@ class TestChatServiceTaxIntegration:
             marketplace_codes=("EBAY_US",),
             destination_country="CL",
         )
-        mock_gemini.classify_intent = AsyncMock(return_value=success(IntentType.SEARCH))
-        mock_gemini.extract_search_intent = AsyncMock(return_value=success(sample_search_intent))
-        mock_search.search = AsyncMock(return_value=success(result))
+        mock_gemini.classify_intent.return_value = _SEARCH
+        mock_gemini.extract_search_intent.return_value = _SEARCH_INTENT
+        mock_search.search.return_value = success(result)
 
         response = await chat_service.process(request)
 
         assert response.is_success
-        assert "exento" in response.message.lower()
+        assert _TAX_EXEMPT in response.message.lower()
 
-    @pytest.mark.asyncio()
+    @pytest.mark.asyncio
     async def test_search_passes_destination_country(
         self,
         chat_service: ChatService,
-        mock_gemini: MagicMock,
-        mock_search: MagicMock,
-        sample_search_intent: SearchIntent,
-        sample_aggregated_result: AggregatedResult,
+        mock_gemini: _GeminiStub,
+        mock_search: _SearchStub,
     ) -> None:
         """Should pass destination_country to search orchestrator."""
         request = ChatRequest(
@@ -736,33 +823,30 @@ class TestChatServiceTaxIntegration:
             marketplace_codes=("EBAY_US",),
             destination_country="CL",
         )
-        mock_gemini.classify_intent = AsyncMock(return_value=success(IntentType.SEARCH))
-        mock_gemini.extract_search_intent = AsyncMock(return_value=success(sample_search_intent))
-        mock_search.search = AsyncMock(return_value=success(sample_aggregated_result))
+        mock_gemini.classify_intent.return_value = _SEARCH
+        mock_gemini.extract_search_intent.return_value = _SEARCH_INTENT
+        mock_search.search.return_value = _AGGREGATED_RESULT
 
         await chat_service.process(request)
 
         # Verify search was called with destination_country
-        call_args = mock_search.search.call_args
-        search_request = call_args[0][0]
+        search_request = mock_search.search.args[0]
         assert search_request.destination_country == "CL"
 
 
 class TestChatServiceClose:
     """Tests for ChatService.close method."""
 
-    @pytest.mark.asyncio()
+    @pytest.mark.asyncio
     async def test_close(
         self,
         chat_service: ChatService,
-        mock_search: MagicMock,
+        mock_search: _SearchStub,
     ) -> None:
         """Close should close search orchestrator."""
-        mock_search.close = AsyncMock()
-
         await chat_service.close()
 
-        mock_search.close.assert_called_once()
+        assert mock_search.close.calls == 1
 
 
 class TestChatTypes:
@@ -196,6 +196,7 @@ def _refinement_request(
 class TestProcessAndDispatch:
     """Cover the top-level process flow and intent dispatch."""
 
+    @pytest.mark.asyncio
     async def test_search_success(
         self,
         chat_service: ChatService,
@@ -219,6 +220,7 @@ class TestProcessAndDispatch:
         assert response.is_success
         assert response.intent_type == IntentType.SEARCH
 
+    @pytest.mark.asyncio
     async def test_classify_failure(
         self,
         chat_service: ChatService,
@@ -235,6 +237,7 @@ class TestProcessAndDispatch:
         assert not response.is_success
         assert "reformularla" in response.message
 
+    @pytest.mark.asyncio
     async def test_unexpected_exception(
         self,
         chat_service: ChatService,
@@ -251,6 +254,7 @@ class TestProcessAndDispatch:
         assert not response.is_success
         assert "error" in response.message.lower()
 
+    @pytest.mark.asyncio
     async def test_extract_search_failure(
         self,
         chat_service: ChatService,
@@ -268,6 +272,7 @@ class TestProcessAndDispatch:
         assert not response.is_success
         assert "específico" in response.message
 
+    @pytest.mark.asyncio
     async def test_no_marketplaces(
         self,
         chat_service: ChatService,
@@ -286,6 +291,7 @@ class TestProcessAndDispatch:
         assert response.is_success
         assert "selecciona" in response.message.lower()
 
+    @pytest.mark.asyncio
     async def test_search_failure(
         self,
         chat_service: ChatService,
@@ -309,6 +315,7 @@ class TestProcessAndDispatch:
 
         assert not response.is_success
 
+    @pytest.mark.asyncio
     async def test_clarification(
         self,
         chat_service: ChatService,
@@ -325,6 +332,7 @@ class TestProcessAndDispatch:
         assert response.is_success
         assert response.intent_type == IntentType.CLARIFICATION
 
+    @pytest.mark.asyncio
     async def test_comparison_defaults_to_search(
         self,
         chat_service: ChatService,
@@ -352,6 +360,7 @@ class TestProcessAndDispatch:
 class TestMoreResults:
     """Cover the more-results handler."""
 
+    @pytest.mark.asyncio
     async def test_without_context(
         self,
         chat_service: ChatService,
@@ -368,6 +377,7 @@ class TestMoreResults:
         assert response.is_success
         assert "búsqueda previa" in response.message.lower()
 
+    @pytest.mark.asyncio
     async def test_with_context_reexecutes_search(
         self,
         chat_service: ChatService,
@@ -396,6 +406,7 @@ class TestMoreResults:
 class TestRefinement:
     """Cover every branch of the refinement handler."""
 
+    @pytest.mark.asyncio
     async def test_no_context_treated_as_new_search(
         self,
         chat_service: ChatService,
@@ -416,6 +427,7 @@ class TestRefinement:
         assert response.is_success
         mock_gemini.extract_search_intent.assert_called_once()
 
+    @pytest.mark.asyncio
     async def test_extract_refinement_failure_falls_back_with_context(
         self,
         chat_service: ChatService,
@@ -438,6 +450,7 @@ class TestRefinement:
         # search-with-context builds a combined query and runs a normal search
         mock_gemini.extract_search_intent.assert_called_once()
 
+    @pytest.mark.asyncio
     async def test_full_filter_criteria_and_sort_preference(
         self,
         chat_service: ChatService,
@@ -497,6 +510,7 @@ class TestRefinement:
         assert search_request.intent.min_seller_rating == 4.5
         assert search_request.intent.sort_criteria[0] == SortOrder.PRICE_ASC
 
+    @pytest.mark.asyncio
     async def test_sort_preference_unknown_is_ignored(
         self,
         chat_service: ChatService,
@@ -521,6 +535,7 @@ class TestRefinement:
 
         assert response.is_success
 
+    @pytest.mark.asyncio
     async def test_refinement_type_cheapest(
         self,
         chat_service: ChatService,
@@ -543,6 +558,7 @@ class TestRefinement:
         search_request = mock_search.search.call_args[0][0]
         assert search_request.intent.sort_criteria[0] == SortOrder.PRICE_ASC
 
+    @pytest.mark.asyncio
     async def test_refinement_type_best_rated_defaults_rating(
         self,
         chat_service: ChatService,
@@ -566,6 +582,7 @@ class TestRefinement:
         assert search_request.intent.min_seller_rating == 4.0
         assert search_request.intent.sort_criteria[0] == SortOrder.BEST_SELLER
 
+    @pytest.mark.asyncio
     async def test_refinement_type_best_rated_keeps_existing_rating(
         self,
         chat_service: ChatService,
@@ -592,6 +609,7 @@ class TestRefinement:
         search_request = mock_search.search.call_args[0][0]
         assert search_request.intent.min_seller_rating == 4.8
 
+    @pytest.mark.asyncio
     async def test_refinement_search_failure(
         self,
         chat_service: ChatService,
@@ -624,6 +642,7 @@ class TestRefinement:
 class TestHandleSearchWithContext:
     """Cover the search-with-context handler's no-intent branch directly."""
 
+    @pytest.mark.asyncio
     async def test_no_last_intent_delegates_to_search(
         self,
         chat_service: ChatService,
@@ -793,6 +812,7 @@ class TestMisc:
         assert response.message == "Solo mensaje"
         assert not response.is_success
 
+    @pytest.mark.asyncio
     async def test_close_closes_search(
         self,
         chat_service: ChatService,
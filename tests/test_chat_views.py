@@ -3,29 +3,110 @@
 from __future__ import annotations
 
 from decimal import Decimal
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 from unittest.mock import MagicMock, patch
 
 import pytest
-from django.test import Client
+from django.conf import settings
+from django.test import Client, RequestFactory
 from django.urls import reverse
 
+from apps.accounts.models import User
+from apps.chat import views
 from apps.chat.models import Conversation, Message
 
 if TYPE_CHECKING:
-    from apps.accounts.models import User
+    from collections.abc import Callable, Iterator
+
+    from django.http import HttpRequest, HttpResponse
+    from pytest_django import DjangoAssertNumQueries, DjangoDbBlocker
+
+
+# Queries allowed for one send_message round trip with _process_chat mocked:
+# session + user lookup, conversation fetch and marketplace update, and the
+# user/assistant message inserts. A new N+1 in the view trips this budget.
+_SEND_MESSAGE_QUERY_BUDGET = 6
+
+# Product payloads returned by the mocked _process_chat. The view only reads
+# them (it serializes copies before saving), so they are built once per module.
+_BEST_PRICE_PRODUCT: dict[str, Any] = {
+    "id": "123",
+    "title": "Gaming Laptop RTX 4060",
+    "price": Decimal("999.99"),
+    "currency": "USD",
+    "url": "https://example.com/123",
+    "image_url": "https://example.com/img.jpg",
+    "marketplace_code": "EBAY_US",
+    "marketplace_name": "eBay United States",
+    "seller_rating": 4.5,
+    "shipping_cost": None,
+    "free_shipping": True,
+    "is_best_price": True,
+    "tax_info": None,
+}
+
+_TAXED_PRODUCT: dict[str, Any] = {
+    "id": "123",
+    "title": "Laptop",
+    "price": Decimal("100"),
+    "currency": "USD",
+    "url": "https://example.com/123",
+    "image_url": None,
+    "marketplace_code": "EBAY_US",
+    "marketplace_name": "eBay US",
+    "seller_rating": None,
+    "shipping_cost": Decimal("20"),
+    "free_shipping": False,
+    "is_best_price": False,
+    "tax_info": {
+        "product_price_usd": 100.0,
+        "shipping_cost_usd": 20.0,
+        "customs_duty": 6.00,
+        "vat": 23.94,
+        "total_taxes": 29.94,
+        "total_with_taxes": 149.94,
+        "de_minimis_applied": False,
+    },
+}
+
+
+@pytest.fixture(scope="module")
+def _module_user(django_db_setup: None, django_db_blocker: DjangoDbBlocker) -> Iterator[User]:
+    """
+    Create the test user once for the whole module.
+
+    It is committed outside the per-test transaction, so every test's rollback
+    leaves it in place; it is deleted again when the module finishes. Tests log
+    in with ``force_login``, so no password is hashed.
+    """
+    with django_db_blocker.unblock():
+        user = User.objects.create_user(
+            username="testuser",
+            email="test@example.com",
+            password=None,
+        )
+    yield user
+    with django_db_blocker.unblock():
+        user.delete()
 
 
 @pytest.fixture()
-def user(db: None) -> User:
-    """Create a test user."""
-    from apps.accounts.models import User
-
-    return User.objects.create_user(
-        username="testuser",
-        email="test@example.com",
-        password="testpass123",
-    )
+def user(db: None, _module_user: User) -> User:
+    """Return the module's test user inside the test transaction."""
+    return _module_user
+
+
+@pytest.fixture(scope="module")
+def _module_session_key(_module_user: User, django_db_blocker: DjangoDbBlocker) -> Iterator[str]:
+    """Log the module user in once and return the session key it was given."""
+    login_client = Client()
+    with django_db_blocker.unblock():
+        login_client.force_login(_module_user)
+        session_key = login_client.session.session_key
+    assert session_key is not None
+    yield session_key
+    with django_db_blocker.unblock():
+        login_client.logout()
 
 
 @pytest.fixture()
@@ -37,145 +118,193 @@ def conversation(user: User) -> Conversation:
     )
 
 
+@pytest.fixture(scope="module")
+def index_url() -> str:
+    """Resolve the chat index URL once per module."""
+    return reverse("chat:index")
+
+
+@pytest.fixture(scope="module")
+def send_message_url() -> str:
+    """Resolve the send message URL once per module."""
+    return reverse("chat:send_message")
+
+
+@pytest.fixture(scope="module")
+def load_more_url() -> str:
+    """Resolve the load more URL once per module."""
+    return reverse("chat:load_more")
+
+
 @pytest.fixture()
-def client() -> Client:
-    """Return Django test client."""
-    return Client()
+def authed_client(client: Client, _module_session_key: str) -> Client:
+    """Return a test client carrying the module user's session cookie."""
+    client.cookies[settings.SESSION_COOKIE_NAME] = _module_session_key
+    return client
+
+
+@pytest.mark.django_db
+class TestChatViewAccess:
+    """Tests for login and HTTP method guards shared by the chat views."""
+
+    @pytest.mark.parametrize(
+        ("url_fixture", "method"),
+        [
+            ("index_url", "get"),
+            ("send_message_url", "post"),
+            ("load_more_url", "post"),
+        ],
+    )
+    def test_requires_login(
+        self,
+        client: Client,
+        url_fixture: str,
+        method: str,
+        request: pytest.FixtureRequest,
+    ) -> None:
+        """Chat views redirect anonymous users to login."""
+        response = getattr(client, method)(request.getfixturevalue(url_fixture))
+
+        assert response.status_code == 302
+        assert "login" in response["Location"]
+
+    @pytest.mark.parametrize("view", [views.send_message, views.load_more])
+    def test_requires_post(
+        self,
+        rf: RequestFactory,
+        user: User,
+        view: Callable[[HttpRequest], HttpResponse],
+    ) -> None:
+        """HTMX endpoints only accept POST."""
+        request = rf.get("/")
+        request.user = user
+
+        response = view(request)
+
+        assert response.status_code == 405
 
 
 @pytest.mark.django_db
 class TestChatIndexView:
     """Tests for chat index view."""
 
-    def test_index_renders_for_authenticated_user(self, client: Client, user: User) -> None:
+    def test_index_renders_for_authenticated_user(
+        self, authed_client: Client, index_url: str
+    ) -> None:
         """Chat index renders for authenticated user."""
-        client.force_login(user)
-        response = client.get(reverse("chat:index"))
+        response = authed_client.get(index_url)
 
         assert response.status_code == 200
         assert b"Shopping Assistant" in response.content
 
-    def test_index_requires_login(self, client: Client) -> None:
-        """Chat index requires authentication."""
-        response = client.get(reverse("chat:index"))
-
-        assert response.status_code == 302
-        assert "login" in response["Location"]
-
-    def test_index_creates_conversation_if_none(self, client: Client, user: User) -> None:
+    def test_index_creates_conversation_if_none(
+        self, authed_client: Client, user: User, index_url: str
+    ) -> None:
         """Chat index creates conversation if user has none."""
-        client.force_login(user)
         assert Conversation.objects.filter(user=user).count() == 0
 
-        client.get(reverse("chat:index"))
+        authed_client.get(index_url)
 
         assert Conversation.objects.filter(user=user).count() == 1
 
     def test_index_uses_existing_conversation(
-        self, client: Client, user: User, conversation: Conversation
+        self, authed_client: Client, conversation: Conversation, index_url: str
     ) -> None:
         """Chat index uses existing conversation."""
-        client.force_login(user)
-
-        response = client.get(reverse("chat:index"))
+        response = authed_client.get(index_url)
 
         assert response.status_code == 200
-        assert str(conversation.id) in response.content.decode()
+        assert str(conversation.id).encode() in response.content
 
-    def test_index_includes_marketplace_selector(self, client: Client, user: User) -> None:
+    def test_index_includes_marketplace_selector(
+        self, authed_client: Client, index_url: str
+    ) -> None:
         """Chat index includes eBay marketplace checkbox."""
-        client.force_login(user)
-        response = client.get(reverse("chat:index"))
+        response = authed_client.get(index_url)
 
-        content = response.content.decode()
-        assert "EBAY_US" in content
-        assert "marketplace" in content
+        content = response.content
+        assert b"EBAY_US" in content
+        assert b"marketplace" in content
 
-    def test_index_template_renders_without_syntax_errors(self, client: Client, user: User) -> None:
+    def test_index_template_renders_without_syntax_errors(
+        self, authed_client: Client, index_url: str
+    ) -> None:
         """Chat index template renders completely without Django template errors."""
-        client.force_login(user)
-        response = client.get(reverse("chat:index"))
+        response = authed_client.get(index_url)
 
         # Should return 200, not 500 (template error)
         assert response.status_code == 200
         # Should contain closing HTML tag (template fully rendered)
         assert b"</html>" in response.content
         # Should not contain unrendered template tags
-        content = response.content.decode()
-        assert "{% if" not in content or "endfor" not in content
-        assert "{{ " not in content or "}}" in content
+        content = response.content
+        assert b"{% if" not in content or b"endfor" not in content
+        assert b"{{ " not in content or b"}}" in content
 
     @patch("core.config.get_settings")
     def test_index_shows_mercadolibre_when_enabled(
-        self, mock_settings: MagicMock, client: Client, user: User
+        self, mock_settings: MagicMock, authed_client: Client, index_url: str
     ) -> None:
         """Chat index shows MercadoLibre options when feature flag is enabled."""
         mock_config = MagicMock()
         mock_config.enable_mercadolibre = True
         mock_settings.return_value = mock_config
 
-        client.force_login(user)
-        response = client.get(reverse("chat:index"))
+        response = authed_client.get(index_url)
 
-        content = response.content.decode()
-        assert "MLC" in content
-        assert "MLA" in content
+        content = response.content
+        assert b"MLC" in content
+        assert b"MLA" in content
 
     @patch("core.config.get_settings")
     def test_index_hides_mercadolibre_when_disabled(
-        self, mock_settings: MagicMock, client: Client, user: User
+        self, mock_settings: MagicMock, authed_client: Client, index_url: str
     ) -> None:
         """Chat index hides MercadoLibre options when feature flag is disabled."""
         mock_config = MagicMock()
         mock_config.enable_mercadolibre = False
         mock_settings.return_value = mock_config
 
-        client.force_login(user)
-        response = client.get(reverse("chat:index"))
+        response = authed_client.get(index_url)
 
-        content = response.content.decode()
+        content = response.content
         # MLC/MLA checkboxes should not be in the content
-        assert 'value="MLC"' not in content
-        assert 'value="MLA"' not in content
+        assert b'value="MLC"' not in content
+        assert b'value="MLA"' not in content
 
 
 @pytest.mark.django_db
 class TestSendMessageView:
     """Tests for send message HTMX view."""
 
-    def test_send_message_requires_login(self, client: Client) -> None:
-        """Send message requires authentication."""
-        response = client.post(reverse("chat:send_message"))
-
-        assert response.status_code == 302
-        assert "login" in response["Location"]
-
-    def test_send_message_requires_post(self, client: Client, user: User) -> None:
-        """Send message only accepts POST."""
-        client.force_login(user)
-        response = client.get(reverse("chat:send_message"))
-
-        assert response.status_code == 405
+    @pytest.fixture(autouse=True)
+    def mock_process(self) -> Iterator[MagicMock]:
+        """Patch _process_chat for every test with an empty default reply."""
+        with patch("apps.chat.views._process_chat") as mock:
+            mock.return_value = {"message": "Response", "products": [], "has_more": False}
+            yield mock
 
     def test_send_message_requires_message(
-        self, client: Client, user: User, conversation: Conversation
+        self, authed_client: Client, conversation: Conversation, send_message_url: str
     ) -> None:
         """Send message requires message content."""
-        client.force_login(user)
-        response = client.post(
-            reverse("chat:send_message"),
+        response = authed_client.post(
+            send_message_url,
             {"conversation_id": str(conversation.id)},
         )
 
         assert response.status_code == 400
 
-    @patch("apps.chat.views._process_chat")
+    @patch("apps.chat.views.render_to_string", return_value="")
     def test_send_message_success(
         self,
+        mock_render: MagicMock,
         mock_process: MagicMock,
-        client: Client,
+        authed_client: Client,
         user: User,
         conversation: Conversation,
+        send_message_url: str,
+        django_assert_max_num_queries: DjangoAssertNumQueries,
     ) -> None:
         """Send message returns the assistant message HTML partial."""
         mock_process.return_value = {
@@ -184,29 +313,32 @@ class TestSendMessageView:
             "has_more": False,
         }
 
-        client.force_login(user)
-        response = client.post(
-            reverse("chat:send_message"),
-            {
-                "message": "Busco un laptop",
-                "conversation_id": str(conversation.id),
-                "marketplaces": "EBAY_US,MLC",
-            },
-        )
+        with django_assert_max_num_queries(_SEND_MESSAGE_QUERY_BUDGET):
+            response = authed_client.post(
+                send_message_url,
+                {
+                    "message": "Busco un laptop",
+                    "conversation_id": str(conversation.id),
+                    "marketplaces": "EBAY_US,MLC",
+                },
+            )
 
         assert response.status_code == 200
-        content = response.content.decode()
-        # The server returns only the assistant message partial; the user message is
+        # The server renders only the assistant message partial; the user message is
         # rendered client-side (see the send_message view).
-        assert "Encontr" in content
+        template_name, context = mock_render.call_args.args
+        assert template_name == "chat/partials/assistant_message.html"
+        assert context["message"].startswith("Encontr")
+        assert context["conversation_id"] == str(conversation.id)
 
-    @patch("apps.chat.views._process_chat")
+    @patch("apps.chat.views.render_to_string", return_value="")
     def test_send_message_saves_messages(
         self,
+        mock_render: MagicMock,
         mock_process: MagicMock,
-        client: Client,
-        user: User,
+        authed_client: Client,
         conversation: Conversation,
+        send_message_url: str,
     ) -> None:
         """Send message saves both user and assistant messages."""
         mock_process.return_value = {
@@ -215,9 +347,8 @@ class TestSendMessageView:
             "has_more": False,
         }
 
-        client.force_login(user)
-        client.post(
-            reverse("chat:send_message"),
+        authed_client.post(
+            send_message_url,
             {
                 "message": "Find a laptop",
                 "conversation_id": str(conversation.id),
@@ -225,100 +356,58 @@ class TestSendMessageView:
             },
         )
 
-        messages = Message.objects.filter(conversation=conversation).order_by("created_at")
-        assert messages.count() == 2
+        messages = list(Message.objects.filter(conversation=conversation).order_by("created_at"))
+        assert len(messages) == 2
         assert messages[0].role == Message.Role.USER
         assert messages[0].content == "Find a laptop"
         assert messages[1].role == Message.Role.ASSISTANT
 
-    @patch("apps.chat.views._process_chat")
     def test_send_message_with_products(
         self,
         mock_process: MagicMock,
-        client: Client,
-        user: User,
+        authed_client: Client,
         conversation: Conversation,
+        send_message_url: str,
+        django_assert_max_num_queries: DjangoAssertNumQueries,
     ) -> None:
         """Send message includes products in response."""
         mock_process.return_value = {
             "message": "Found products",
-            "products": [
-                {
-                    "id": "123",
-                    "title": "Gaming Laptop RTX 4060",
-                    "price": Decimal("999.99"),
-                    "currency": "USD",
-                    "url": "https://example.com/123",
-                    "image_url": "https://example.com/img.jpg",
-                    "marketplace_code": "EBAY_US",
-                    "marketplace_name": "eBay United States",
-                    "seller_rating": 4.5,
-                    "shipping_cost": None,
-                    "free_shipping": True,
-                    "is_best_price": True,
-                    "tax_info": None,
-                },
-            ],
+            "products": [_BEST_PRICE_PRODUCT],
             "has_more": True,
         }
 
-        client.force_login(user)
-        response = client.post(
-            reverse("chat:send_message"),
-            {
-                "message": "Find laptop",
-                "conversation_id": str(conversation.id),
-                "marketplaces": "EBAY_US",
-            },
-        )
+        with django_assert_max_num_queries(_SEND_MESSAGE_QUERY_BUDGET):
+            response = authed_client.post(
+                send_message_url,
+                {
+                    "message": "Find laptop",
+                    "conversation_id": str(conversation.id),
+                    "marketplaces": "EBAY_US",
+                },
+            )
 
-        content = response.content.decode()
-        assert "Gaming Laptop RTX 4060" in content
-        assert "Best Price" in content
-        assert "eBay United States" in content
+        content = response.content
+        assert b"Gaming Laptop RTX 4060" in content
+        assert b"Best Price" in content
+        assert b"eBay United States" in content
 
-    @patch("apps.chat.views._process_chat")
     def test_send_message_with_tax_info(
         self,
         mock_process: MagicMock,
-        client: Client,
-        user: User,
+        authed_client: Client,
         conversation: Conversation,
+        send_message_url: str,
     ) -> None:
         """Send message includes tax breakdown when available."""
         mock_process.return_value = {
             "message": "Found products",
-            "products": [
-                {
-                    "id": "123",
-                    "title": "Laptop",
-                    "price": Decimal("100"),
-                    "currency": "USD",
-                    "url": "https://example.com/123",
-                    "image_url": None,
-                    "marketplace_code": "EBAY_US",
-                    "marketplace_name": "eBay US",
-                    "seller_rating": None,
-                    "shipping_cost": Decimal("20"),
-                    "free_shipping": False,
-                    "is_best_price": False,
-                    "tax_info": {
-                        "product_price_usd": 100.0,
-                        "shipping_cost_usd": 20.0,
-                        "customs_duty": 6.00,
-                        "vat": 23.94,
-                        "total_taxes": 29.94,
-                        "total_with_taxes": 149.94,
-                        "de_minimis_applied": False,
-                    },
-                },
-            ],
+            "products": [_TAXED_PRODUCT],
             "has_more": False,
         }
 
-        client.force_login(user)
-        response = client.post(
-            reverse("chat:send_message"),
+        response = authed_client.post(
+            send_message_url,
             {
                 "message": "Find laptop",
                 "conversation_id": str(conversation.id),
@@ -327,28 +416,22 @@ class TestSendMessageView:
             },
         )
 
-        content = response.content.decode()
-        assert "Customs" in content
-        assert "VAT" in content
-        assert "Total landed" in content
+        content = response.content
+        assert b"Customs" in content
+        assert b"VAT" in content
+        assert b"Total landed" in content
 
-    @patch("apps.chat.views._process_chat")
+    @patch("apps.chat.views.render_to_string", return_value="")
     def test_send_message_creates_conversation_if_invalid(
         self,
-        mock_process: MagicMock,
-        client: Client,
+        mock_render: MagicMock,
+        authed_client: Client,
         user: User,
+        send_message_url: str,
     ) -> None:
         """Send message creates new conversation if ID is invalid."""
-        mock_process.return_value = {
-            "message": "Response",
-            "products": [],
-            "has_more": False,
-        }
-
-        client.force_login(user)
-        client.post(
-            reverse("chat:send_message"),
+        authed_client.post(
+            send_message_url,
             {
                 "message": "Hello",
                 "conversation_id": "invalid-uuid",
@@ -359,12 +442,14 @@ class TestSendMessageView:
         # Should have created a new conversation
         assert Conversation.objects.filter(user=user).count() == 1
 
-    @patch("apps.chat.views._process_chat")
+    @patch("apps.chat.views.render_to_string", return_value="")
     def test_send_message_creates_conversation_if_no_id(
         self,
+        mock_render: MagicMock,
         mock_process: MagicMock,
-        client: Client,
+        authed_client: Client,
         user: User,
+        send_message_url: str,
     ) -> None:
         """Send message creates new conversation if no ID provided."""
         mock_process.return_value = {
@@ -374,9 +459,8 @@ class TestSendMessageView:
             "generated_title": "Hello there",  # Title is now generated by Gemini
         }
 
-        client.force_login(user)
-        client.post(
-            reverse("chat:send_message"),
+        authed_client.post(
+            send_message_url,
             {
                 "message": "Hello there",
                 "marketplaces": "MLC",
@@ -389,24 +473,18 @@ class TestSendMessageView:
         assert conv is not None
         assert conv.title == "Hello there"
 
-    @patch("apps.chat.views._process_chat")
+    @patch("apps.chat.views.render_to_string", return_value="")
     def test_send_message_uses_default_marketplaces(
         self,
+        mock_render: MagicMock,
         mock_process: MagicMock,
-        client: Client,
-        user: User,
+        authed_client: Client,
         conversation: Conversation,
+        send_message_url: str,
     ) -> None:
         """Send message uses default marketplaces if none provided."""
-        mock_process.return_value = {
-            "message": "Response",
-            "products": [],
-            "has_more": False,
-        }
-
-        client.force_login(user)
-        client.post(
-            reverse("chat:send_message"),
+        authed_client.post(
+            send_message_url,
             {
                 "message": "Hello",
                 "conversation_id": str(conversation.id),
@@ -419,20 +497,20 @@ class TestSendMessageView:
         assert "EBAY_US" in call_kwargs["marketplaces"]
         assert "MLC" in call_kwargs["marketplaces"]
 
-    @patch("apps.chat.views._process_chat")
+    @patch("apps.chat.views.render_to_string", return_value="")
     def test_send_message_handles_error(
         self,
+        mock_render: MagicMock,
         mock_process: MagicMock,
-        client: Client,
-        user: User,
+        authed_client: Client,
         conversation: Conversation,
+        send_message_url: str,
     ) -> None:
         """Send message returns error message on exception."""
         mock_process.side_effect = RuntimeError("Something went wrong")
 
-        client.force_login(user)
-        response = client.post(
-            reverse("chat:send_message"),
+        response = authed_client.post(
+            send_message_url,
             {
                 "message": "Hello",
                 "conversation_id": str(conversation.id),
@@ -441,31 +519,17 @@ class TestSendMessageView:
         )
 
         assert response.status_code == 200
-        content = response.content.decode()
-        assert "error" in content.lower() or "Lo siento" in content
+        message = mock_render.call_args.args[1]["message"]
+        assert "error" in message.lower() or "Lo siento" in message
 
 
 @pytest.mark.django_db
 class TestLoadMoreView:
     """Tests for load more HTMX view."""
 
-    def test_load_more_requires_login(self, client: Client) -> None:
-        """Load more requires authentication."""
-        response = client.post(reverse("chat:load_more"))
-
-        assert response.status_code == 302
-
-    def test_load_more_requires_post(self, client: Client, user: User) -> None:
-        """Load more only accepts POST."""
-        client.force_login(user)
-        response = client.get(reverse("chat:load_more"))
-
-        assert response.status_code == 405
-
-    def test_load_more_returns_empty(self, client: Client, user: User) -> None:
+    def test_load_more_returns_empty(self, authed_client: Client, load_more_url: str) -> None:
         """Load more returns empty for now (pagination not implemented)."""
-        client.force_login(user)
-        response = client.post(reverse("chat:load_more"))
+        response = authed_client.post(load_more_url)
 
         assert response.status_code == 200
         assert response.content == b""
@@ -3,13 +3,11 @@
 from __future__ import annotations
 
 import os
-from typing import TYPE_CHECKING
+from typing import Any
 
+import pytest
 from pydantic import SecretStr
 
-if TYPE_CHECKING:
-    import pytest
-
 from core.config import (
     DatabaseSettings,
     EbaySettings,
@@ -20,18 +18,55 @@ from core.config import (
     get_settings,
 )
 
+# SecretStr is immutable, so the credentials used across tests are shared.
+_TESTPASS = SecretStr("testpass")
+_SECRETPASS = SecretStr("secretpass")
+_SECRET123 = SecretStr("secret123")
+_ML_SECRET = SecretStr("secret")
+_EBAY_CERT = SecretStr("cert123")
+_GEMINI_KEY = SecretStr("api-key-123")
+
+# Default-value tests only read the settings objects, so each class is built
+# once per module instead of re-reading the environment in every test.
+
+
+@pytest.fixture(scope="module")
+def db_defaults() -> DatabaseSettings:
+    """Build DatabaseSettings with any DB_* / DATABASE_URL overrides removed."""
+    clean_env = {
+        key: value
+        for key, value in os.environ.items()
+        if not (key.startswith("DB_") or key == "DATABASE_URL")
+    }
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(os, "environ", clean_env)
+        return DatabaseSettings()
+
+
+@pytest.fixture(scope="module")
+def redis_defaults() -> RedisSettings:
+    """Build RedisSettings from the environment once."""
+    return RedisSettings()
+
+
+@pytest.fixture(scope="module")
+def gemini_defaults() -> GeminiSettings:
+    """Build GeminiSettings from the environment once."""
+    return GeminiSettings()
+
+
+@pytest.fixture(scope="module")
+def settings_defaults() -> Settings:
+    """Build the top-level Settings from the environment once."""
+    return Settings()
+
 
 class TestDatabaseSettings:
     """Tests for DatabaseSettings."""
 
-    def test_default_values(self, monkeypatch: pytest.MonkeyPatch) -> None:
+    def test_default_values(self, db_defaults: DatabaseSettings) -> None:
         """DatabaseSettings should have sensible defaults."""
-        # Clear any environment variables that could affect defaults
-        for key in list(os.environ.keys()):
-            if key.startswith("DB_") or key == "DATABASE_URL":
-                monkeypatch.delenv(key, raising=False)
-
-        settings = DatabaseSettings()
+        settings = db_defaults
 
         assert settings.name == "ecommerce_recommendator"
         assert settings.user == "postgres"
@@ -44,7 +79,7 @@ class TestDatabaseSettings:
         settings = DatabaseSettings(
             name="testdb",
             user="testuser",
-            password=SecretStr("testpass"),
+            password=_TESTPASS,
             host="testhost",
             port=5433,
         )
@@ -102,7 +137,7 @@ class TestDatabaseSettings:
         settings = DatabaseSettings(
             name="testdb",
             user="testuser",
-            password=SecretStr("secretpass"),
+            password=_SECRETPASS,
             host="testhost",
             port=5433,
         )
@@ -124,7 +159,7 @@ class TestDatabaseSettings:
 
     def test_password_is_secret(self) -> None:
         """Password should be stored as SecretStr."""
-        settings = DatabaseSettings(password=SecretStr("secret123"))
+        settings = DatabaseSettings(password=_SECRET123)
 
         assert settings.password.get_secret_value() == "secret123"
 
@@ -132,101 +167,80 @@ class TestDatabaseSettings:
 class TestRedisSettings:
     """Tests for RedisSettings."""
 
-    def test_default_url(self) -> None:
+    def test_default_url(self, redis_defaults: RedisSettings) -> None:
         """RedisSettings should have default localhost URL."""
-        settings = RedisSettings()
-
-        assert settings.url == "redis://localhost:6379/0"
+        assert redis_defaults.url == "redis://localhost:6379/0"
 
 
 class TestMercadoLibreSettings:
     """Tests for MercadoLibreSettings."""
 
-    def test_is_configured_false_when_empty(self) -> None:
-        """is_configured should return False when credentials are empty."""
-        settings = MercadoLibreSettings()
-
-        assert settings.is_configured is False
-
-    def test_is_configured_true_when_set(self) -> None:
-        """is_configured should return True when all credentials are set."""
-        settings = MercadoLibreSettings(
-            app_id="12345",
-            client_secret=SecretStr("secret"),
-        )
-
-        assert settings.is_configured is True
-
-    def test_is_configured_false_with_only_app_id(self) -> None:
-        """is_configured should return False with only app_id."""
-        settings = MercadoLibreSettings(app_id="12345")
-
-        assert settings.is_configured is False
+    @pytest.mark.parametrize(
+        ("kwargs", "expected"),
+        [
+            pytest.param({}, False, id="empty"),
+            pytest.param({"app_id": "12345"}, False, id="only_app_id"),
+            pytest.param({"app_id": "12345", "client_secret": _ML_SECRET}, True, id="all_set"),
+        ],
+    )
+    def test_is_configured(self, kwargs: dict[str, Any], expected: bool) -> None:
+        """is_configured should be True only when app_id and client_secret are set."""
+        assert MercadoLibreSettings(**kwargs).is_configured is expected
 
 
 class TestEbaySettings:
     """Tests for EbaySettings."""
 
-    def test_is_configured_false_when_empty(self) -> None:
-        """is_configured should return False when credentials are empty."""
-        settings = EbaySettings()
-
-        assert settings.is_configured is False
-
-    def test_is_configured_true_when_all_set(self) -> None:
-        """is_configured should return True when all credentials are set."""
-        settings = EbaySettings(
-            app_id="app123",
-            dev_id="dev123",
-            cert_id=SecretStr("cert123"),
-        )
-
-        assert settings.is_configured is True
-
-    def test_is_configured_false_with_partial_creds(self) -> None:
-        """is_configured should return False with partial credentials."""
-        settings = EbaySettings(app_id="app123", dev_id="dev123")
-
-        assert settings.is_configured is False
+    @pytest.mark.parametrize(
+        ("kwargs", "expected"),
+        [
+            pytest.param({}, False, id="empty"),
+            pytest.param({"app_id": "app123", "dev_id": "dev123"}, False, id="partial"),
+            pytest.param(
+                {"app_id": "app123", "dev_id": "dev123", "cert_id": _EBAY_CERT},
+                True,
+                id="all_set",
+            ),
+        ],
+    )
+    def test_is_configured(self, kwargs: dict[str, Any], expected: bool) -> None:
+        """is_configured should be True only when every credential is set."""
+        assert EbaySettings(**kwargs).is_configured is expected
 
 
 class TestGeminiSettings:
     """Tests for GeminiSettings."""
 
-    def test_default_model(self) -> None:
+    def test_default_model(self, gemini_defaults: GeminiSettings) -> None:
         """GeminiSettings should default to gemini-2.0-flash."""
-        settings = GeminiSettings()
+        assert gemini_defaults.model == "gemini-2.0-flash"
 
-        assert settings.model == "gemini-2.0-flash"
-
-    def test_is_configured_false_when_empty(self) -> None:
-        """is_configured should return False when API key is empty."""
-        settings = GeminiSettings()
-
-        assert settings.is_configured is False
-
-    def test_is_configured_true_when_set(self) -> None:
-        """is_configured should return True when API key is set."""
-        settings = GeminiSettings(api_key=SecretStr("api-key-123"))
-
-        assert settings.is_configured is True
+    @pytest.mark.parametrize(
+        ("kwargs", "expected"),
+        [
+            pytest.param({}, False, id="empty"),
+            pytest.param({"api_key": _GEMINI_KEY}, True, id="api_key_set"),
+        ],
+    )
+    def test_is_configured(self, kwargs: dict[str, Any], expected: bool) -> None:
+        """is_configured should be True only when the API key is set."""
+        assert GeminiSettings(**kwargs).is_configured is expected
 
 
 class TestSettings:
     """Tests for main Settings class."""
 
-    def test_default_environment(self) -> None:
+    def test_default_environment(self, settings_defaults: Settings) -> None:
         """Settings should default to development environment."""
-        settings = Settings()
-
-        assert settings.environment == "development"
-        assert settings.debug is False
+        assert settings_defaults.environment == "development"
+        assert settings_defaults.debug is False
 
     def test_environment_properties(self) -> None:
         """Environment properties should work correctly."""
         dev_settings = Settings(environment="development")
-        prod_settings = Settings(environment="production")
-        test_settings = Settings(environment="test")
+        # model_copy shares the nested sections instead of re-reading the env.
+        prod_settings = dev_settings.model_copy(update={"environment": "production"})
+        test_settings = dev_settings.model_copy(update={"environment": "test"})
 
         assert dev_settings.is_development is True
         assert dev_settings.is_production is False
@@ -256,9 +270,9 @@ class TestSettings:
 
         assert settings.allowed_hosts == hosts
 
-    def test_nested_settings(self) -> None:
+    def test_nested_settings(self, settings_defaults: Settings) -> None:
         """Settings should contain nested settings objects."""
-        settings = Settings()
+        settings = settings_defaults
 
         assert isinstance(settings.database, DatabaseSettings)
         assert isinstance(settings.redis, RedisSettings)
@@ -272,18 +286,10 @@ class TestGetSettings:
 
     def test_get_settings_returns_settings(self) -> None:
         """get_settings should return Settings instance."""
-        # Clear cache for test
-        get_settings.cache_clear()
-
         settings = get_settings()
 
         assert isinstance(settings, Settings)
 
     def test_get_settings_is_cached(self) -> None:
         """get_settings should return cached instance."""
-        get_settings.cache_clear()
-
-        settings1 = get_settings()
-        settings2 = get_settings()
-
-        assert settings1 is settings2
+        assert get_settings() is get_settings()
@@ -3,10 +3,10 @@
 from __future__ import annotations
 
 from decimal import Decimal
-from typing import Any
-from unittest.mock import AsyncMock
+from typing import TYPE_CHECKING, Any, cast
 
 import pytest
+import pytest_asyncio
 
 from core.result import Failure, Success
 from services.marketplaces.base import (
@@ -19,38 +19,109 @@ from services.marketplaces.base import (
 from services.marketplaces.ebay.adapter import EbayAdapter
 from services.marketplaces.ebay.client import EbayClient
 from services.marketplaces.errors import ErrorCode, NetworkError
+from tests.stubs import AsyncStub
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from core.result import Result
+    from services.marketplaces.errors import MarketplaceError
+
+# Minimal parseable item summary; parsing tests overlay only the fields they vary.
+_BASE_ITEM: dict[str, Any] = {
+    "itemId": "123",
+    "title": "Test",
+    "price": {"value": "100", "currency": "USD"},
+    "itemWebUrl": "https://example.com",
+}
+# Success and SearchParams are frozen, so canned values can be shared between tests.
+_LAPTOP_PARAMS = SearchParams(query="laptop")
+_EMPTY_SEARCH = Success({"itemSummaries": [], "total": 0, "offset": 0, "limit": 20})
+_SINGLE_ITEM_SEARCH = Success({"itemSummaries": [_BASE_ITEM], "total": 1, "offset": 0, "limit": 20})
+_PARTLY_UNPARSEABLE_SEARCH = Success(
+    {
+        "itemSummaries": [{"invalid": "product"}, _BASE_ITEM],
+        "total": 2,
+        "offset": 0,
+        "limit": 20,
+    }
+)
+
+
+class _FakeEbayClient:
+    """EbayClient double exposing the coroutines EbayAdapter awaits."""
+
+    __slots__ = ("close", "get_item", "healthcheck", "search")
+
+    def __init__(self) -> None:
+        self.search = AsyncStub(EbayClient.search)
+        self.get_item = AsyncStub(EbayClient.get_item)
+        self.healthcheck = AsyncStub(EbayClient.healthcheck)
+        self.close = AsyncStub(EbayClient.close)
+
+    def reset(self) -> None:
+        """Reset every stubbed coroutine."""
+        self.search.reset()
+        self.get_item.reset()
+        self.healthcheck.reset()
+        self.close.reset()
+
+
+@pytest.fixture(scope="module")
+def mock_client() -> _FakeEbayClient:
+    """Create the fake client shared by the module."""
+    return _FakeEbayClient()
+
+
+@pytest.fixture(scope="module")
+def adapter(mock_client: _FakeEbayClient) -> EbayAdapter:
+    """Create adapter with the shared fake client."""
+    return EbayAdapter(app_id="test", cert_id="test", client=cast("EbayClient", mock_client))
+
+
+@pytest.fixture(autouse=True)
+def _reset_client(mock_client: _FakeEbayClient) -> Iterator[None]:
+    """Forget configured results and recorded calls after each test."""
+    yield
+    mock_client.reset()
+
+
+class TestFakeEbayClient:
+    """Tests that the shared fake stays in step with EbayClient."""
+
+    def test_rejects_calls_ebay_client_would_reject(self, mock_client: _FakeEbayClient) -> None:
+        """Stubbed methods should bind every call against the real EbayClient signature."""
+        with pytest.raises(TypeError):
+            mock_client.search(search_term="laptop")
+
+        assert mock_client.search.calls == 0
+
+    def test_requires_coroutine_methods(self) -> None:
+        """Stubs should only stand in for coroutine methods."""
+        with pytest.raises(TypeError, match="not a coroutine function"):
+            AsyncStub(EbayClient._is_token_valid)
 
 
 class TestEbayAdapterInit:
     """Tests for EbayAdapter initialization."""
 
-    def test_adapter_implements_protocol(self) -> None:
+    def test_adapter_implements_protocol(self, adapter: EbayAdapter) -> None:
         """Adapter should implement MarketplaceAdapter protocol."""
-        mock_client = AsyncMock(spec=EbayClient)
-        adapter = EbayAdapter(app_id="test", cert_id="test", client=mock_client)
-
         assert isinstance(adapter, MarketplaceAdapter)
 
-    def test_marketplace_code(self) -> None:
+    def test_marketplace_code(self, adapter: EbayAdapter) -> None:
         """marketplace_code should return marketplace ID."""
-        mock_client = AsyncMock(spec=EbayClient)
-        adapter = EbayAdapter(app_id="test", cert_id="test", client=mock_client)
-
         assert adapter.marketplace_code == "EBAY_US"
 
-    def test_marketplace_name(self) -> None:
+    def test_marketplace_name(self, adapter: EbayAdapter) -> None:
         """marketplace_name should return formatted name."""
-        mock_client = AsyncMock(spec=EbayClient)
-        adapter = EbayAdapter(app_id="test", cert_id="test", client=mock_client)
-
         assert adapter.marketplace_name == "eBay United States"
 
-    def test_marketplace_name_unknown(self) -> None:
+    def test_marketplace_name_unknown(self, mock_client: _FakeEbayClient) -> None:
         """marketplace_name should handle unknown marketplace."""
-        mock_client = AsyncMock(spec=EbayClient)
         adapter = EbayAdapter.__new__(EbayAdapter)
         adapter._marketplace_id = "UNKNOWN"
-        adapter._client = mock_client
+        adapter._client = cast("EbayClient", mock_client)
 
         assert adapter.marketplace_name == "eBay Unknown"
 
@@ -58,19 +129,9 @@ class TestEbayAdapterInit:
 class TestEbayAdapterSearch:
     """Tests for EbayAdapter search method."""
 
-    @pytest.fixture()
-    def mock_client(self) -> AsyncMock:
-        """Create a mock client."""
-        return AsyncMock(spec=EbayClient)
-
-    @pytest.fixture()
-    def adapter(self, mock_client: AsyncMock) -> EbayAdapter:
-        """Create adapter with mock client."""
-        return EbayAdapter(app_id="test", cert_id="test", client=mock_client)
-
-    @pytest.fixture()
+    @pytest.fixture(scope="session")
     def sample_api_response(self) -> dict[str, Any]:
-        """Create sample API response."""
+        """Create sample API response; the adapter only reads it, so it is built once."""
         return {
             "itemSummaries": [
                 {
@@ -100,18 +161,27 @@ class TestEbayAdapterSearch:
             "limit": 20,
         }
 
-    @pytest.mark.asyncio
-    async def test_search_success(
+    @pytest.fixture(scope="session")
+    def sample_search_success(self, sample_api_response: dict[str, Any]) -> Success[dict[str, Any]]:
+        """Wrap the sample API response in the client's Success result."""
+        return Success(sample_api_response)
+
+    @pytest_asyncio.fixture(scope="class")
+    async def sample_search_result(
         self,
         adapter: EbayAdapter,
-        mock_client: AsyncMock,
-        sample_api_response: dict[str, Any],
+        mock_client: _FakeEbayClient,
+        sample_search_success: Success[dict[str, Any]],
+    ) -> Result[SearchResult, MarketplaceError]:
+        """Search the sample response once; the tests below only read the result."""
+        mock_client.search.return_value = sample_search_success
+        return await adapter.search(_LAPTOP_PARAMS)
+
+    def test_search_success(
+        self, sample_search_result: Result[SearchResult, MarketplaceError]
     ) -> None:
         """search should return SearchResult on success."""
-        mock_client.search.return_value = Success(sample_api_response)
-        params = SearchParams(query="laptop")
-
-        result = await adapter.search(params)
+        result = sample_search_result
 
         assert isinstance(result, Success)
         assert isinstance(result.value, SearchResult)
@@ -119,18 +189,11 @@ class TestEbayAdapterSearch:
         assert result.value.has_more is True
         assert len(result.value.products) == 2
 
-    @pytest.mark.asyncio
-    async def test_search_parses_products_correctly(
-        self,
-        adapter: EbayAdapter,
-        mock_client: AsyncMock,
-        sample_api_response: dict[str, Any],
+    def test_search_parses_products_correctly(
+        self, sample_search_result: Result[SearchResult, MarketplaceError]
     ) -> None:
         """search should parse products with correct fields."""
-        mock_client.search.return_value = Success(sample_api_response)
-        params = SearchParams(query="laptop")
-
-        result = await adapter.search(params)
+        result = sample_search_result
 
         assert isinstance(result, Success)
         product = result.value.products[0]
@@ -148,30 +211,26 @@ class TestEbayAdapterSearch:
     async def test_search_with_sort_order(
         self,
         adapter: EbayAdapter,
-        mock_client: AsyncMock,
+        mock_client: _FakeEbayClient,
     ) -> None:
         """search should pass sort order to client."""
-        mock_client.search.return_value = Success(
-            {"itemSummaries": [], "total": 0, "offset": 0, "limit": 20}
-        )
+        mock_client.search.return_value = _EMPTY_SEARCH
         params = SearchParams(query="laptop", sort=SortOrder.PRICE_ASC)
 
         await adapter.search(params)
 
-        mock_client.search.assert_called_once()
-        call_kwargs = mock_client.search.call_args.kwargs
+        assert mock_client.search.calls == 1
+        call_kwargs = mock_client.search.kwargs
         assert call_kwargs["sort"] == "price"
 
     @pytest.mark.asyncio
     async def test_search_with_price_filters(
         self,
         adapter: EbayAdapter,
-        mock_client: AsyncMock,
+        mock_client: _FakeEbayClient,
     ) -> None:
         """search should pass price filters to client."""
-        mock_client.search.return_value = Success(
-            {"itemSummaries": [], "total": 0, "offset": 0, "limit": 20}
-        )
+        mock_client.search.return_value = _EMPTY_SEARCH
         params = SearchParams(
             query="laptop",
             min_price=Decimal("100"),
@@ -180,7 +239,7 @@ class TestEbayAdapterSearch:
 
         await adapter.search(params)
 
-        call_kwargs = mock_client.search.call_args.kwargs
+        call_kwargs = mock_client.search.kwargs
         assert call_kwargs["min_price"] == 100.0
         assert call_kwargs["max_price"] == 500.0
 
@@ -188,14 +247,13 @@ class TestEbayAdapterSearch:
     async def test_search_client_failure(
         self,
         adapter: EbayAdapter,
-        mock_client: AsyncMock,
+        mock_client: _FakeEbayClient,
     ) -> None:
         """search should propagate client errors."""
         error = NetworkError("EBAY_US", message="Connection failed")
         mock_client.search.return_value = Failure(error)
-        params = SearchParams(query="laptop")
 
-        result = await adapter.search(params)
+        result = await adapter.search(_LAPTOP_PARAMS)
 
         assert isinstance(result, Failure)
         assert result.error.code == ErrorCode.NETWORK
@@ -204,96 +262,51 @@ class TestEbayAdapterSearch:
     async def test_search_parse_exception(
         self,
         adapter: EbayAdapter,
-        mock_client: AsyncMock,
+        mock_client: _FakeEbayClient,
     ) -> None:
         """search should return Failure when response causes exception."""
         mock_client.search.return_value = Success(
             {"itemSummaries": None}  # Will cause AttributeError
         )
-        params = SearchParams(query="laptop")
 
-        result = await adapter.search(params)
+        result = await adapter.search(_LAPTOP_PARAMS)
 
         assert isinstance(result, Failure)
         assert result.error.code == ErrorCode.PARSE
 
     @pytest.mark.asyncio
-    async def test_search_has_more_false(
+    @pytest.mark.parametrize(
+        ("response", "expected_ids"),
+        [
+            pytest.param(_EMPTY_SEARCH, [], id="empty"),
+            pytest.param(_SINGLE_ITEM_SEARCH, ["123"], id="single_item"),
+            # Items missing required fields are skipped, not fatal.
+            pytest.param(_PARTLY_UNPARSEABLE_SEARCH, ["123"], id="skips_unparseable"),
+        ],
+    )
+    async def test_search_last_page(
         self,
         adapter: EbayAdapter,
-        mock_client: AsyncMock,
+        mock_client: _FakeEbayClient,
+        response: Success[dict[str, Any]],
+        expected_ids: list[str],
     ) -> None:
-        """search should set has_more=False when no more results."""
-        mock_client.search.return_value = Success(
-            {
-                "itemSummaries": [
-                    {
-                        "itemId": "123",
-                        "title": "Test",
-                        "price": {"value": "100", "currency": "USD"},
-                        "itemWebUrl": "https://example.com",
-                    }
-                ],
-                "total": 1,
-                "offset": 0,
-                "limit": 20,
-            }
-        )
-        params = SearchParams(query="laptop")
+        """search should return the parseable products and has_more=False on the last page."""
+        mock_client.search.return_value = response
 
-        result = await adapter.search(params)
+        result = await adapter.search(_LAPTOP_PARAMS)
 
         assert isinstance(result, Success)
+        assert [product.id for product in result.value.products] == expected_ids
         assert result.value.has_more is False
 
-    @pytest.mark.asyncio
-    async def test_search_skips_unparseable_products(
-        self,
-        adapter: EbayAdapter,
-        mock_client: AsyncMock,
-    ) -> None:
-        """search should skip products that can't be parsed."""
-        mock_client.search.return_value = Success(
-            {
-                "itemSummaries": [
-                    {"invalid": "product"},  # Missing required fields
-                    {
-                        "itemId": "123",
-                        "title": "Valid Product",
-                        "price": {"value": "100", "currency": "USD"},
-                        "itemWebUrl": "https://example.com",
-                    },
-                ],
-                "total": 2,
-                "offset": 0,
-                "limit": 20,
-            }
-        )
-        params = SearchParams(query="laptop")
-
-        result = await adapter.search(params)
-
-        assert isinstance(result, Success)
-        assert len(result.value.products) == 1
-        assert result.value.products[0].id == "123"
-
 
 class TestEbayAdapterGetProduct:
     """Tests for EbayAdapter get_product method."""
 
-    @pytest.fixture()
-    def mock_client(self) -> AsyncMock:
-        """Create a mock client."""
-        return AsyncMock(spec=EbayClient)
-
-    @pytest.fixture()
-    def adapter(self, mock_client: AsyncMock) -> EbayAdapter:
-        """Create adapter with mock client."""
-        return EbayAdapter(app_id="test", cert_id="test", client=mock_client)
-
-    @pytest.fixture()
+    @pytest.fixture(scope="session")
     def sample_item_response(self) -> dict[str, Any]:
-        """Create sample item response."""
+        """Create sample item response; the adapter only reads it, so it is built once."""
         return {
             "itemId": "v1|123456|0",
             "title": "Gaming Laptop",
@@ -312,7 +325,7 @@ class TestEbayAdapterGetProduct:
     async def test_get_product_success(
         self,
         adapter: EbayAdapter,
-        mock_client: AsyncMock,
+        mock_client: _FakeEbayClient,
         sample_item_response: dict[str, Any],
     ) -> None:
         """get_product should return ProductResult on success."""
@@ -328,7 +341,7 @@ class TestEbayAdapterGetProduct:
     async def test_get_product_client_failure(
         self,
         adapter: EbayAdapter,
-        mock_client: AsyncMock,
+        mock_client: _FakeEbayClient,
     ) -> None:
         """get_product should propagate client errors."""
         error = NetworkError("EBAY_US", message="Not found")
@@ -343,7 +356,7 @@ class TestEbayAdapterGetProduct:
     async def test_get_product_parse_error(
         self,
         adapter: EbayAdapter,
-        mock_client: AsyncMock,
+        mock_client: _FakeEbayClient,
     ) -> None:
         """get_product should return ParseError on invalid response."""
         mock_client.get_item.return_value = Success({"invalid": "response"})
@@ -358,134 +371,95 @@ class TestEbayAdapterHealthcheck:
     """Tests for EbayAdapter healthcheck method."""
 
     @pytest.mark.asyncio
-    async def test_healthcheck_delegates_to_client(self) -> None:
+    async def test_healthcheck_delegates_to_client(
+        self, adapter: EbayAdapter, mock_client: _FakeEbayClient
+    ) -> None:
         """healthcheck should delegate to client."""
-        mock_client = AsyncMock(spec=EbayClient)
         mock_client.healthcheck.return_value = True
-        adapter = EbayAdapter(app_id="test", cert_id="test", client=mock_client)
 
         result = await adapter.healthcheck()
 
         assert result is True
-        mock_client.healthcheck.assert_called_once()
+        assert mock_client.healthcheck.calls == 1
 
 
 class TestEbayAdapterClose:
     """Tests for EbayAdapter close method."""
 
     @pytest.mark.asyncio
-    async def test_close_delegates_to_client(self) -> None:
+    async def test_close_delegates_to_client(
+        self, adapter: EbayAdapter, mock_client: _FakeEbayClient
+    ) -> None:
         """close should delegate to client."""
-        mock_client = AsyncMock(spec=EbayClient)
-        adapter = EbayAdapter(app_id="test", cert_id="test", client=mock_client)
-
         await adapter.close()
 
-        mock_client.close.assert_called_once()
+        assert mock_client.close.calls == 1
 
 
 class TestProductParsing:
     """Tests for product parsing edge cases."""
 
-    @pytest.fixture()
-    def adapter(self) -> EbayAdapter:
-        """Create adapter for testing."""
-        mock_client = AsyncMock(spec=EbayClient)
-        return EbayAdapter(app_id="test", cert_id="test", client=mock_client)
-
-    def test_parse_product_with_no_seller_rating(self, adapter: EbayAdapter) -> None:
-        """_parse_product should handle missing seller rating."""
-        item = {
-            "itemId": "123",
-            "title": "Test",
-            "price": {"value": "100", "currency": "USD"},
-            "itemWebUrl": "https://example.com",
-            "seller": {"username": "test"},
-        }
-
-        product = adapter._parse_product(item)
-
-        assert product.seller_rating is None
-
-    def test_parse_product_with_no_shipping(self, adapter: EbayAdapter) -> None:
-        """_parse_product should handle missing shipping."""
-        item = {
-            "itemId": "123",
-            "title": "Test",
-            "price": {"value": "100", "currency": "USD"},
-            "itemWebUrl": "https://example.com",
-        }
-
-        product = adapter._parse_product(item)
-
-        assert product.shipping_cost is None
-        assert product.free_shipping is False
-
-    def test_parse_product_shipping_no_value(self, adapter: EbayAdapter) -> None:
-        """_parse_product should handle shipping without value."""
-        item = {
-            "itemId": "123",
-            "title": "Test",
-            "price": {"value": "100", "currency": "USD"},
-            "itemWebUrl": "https://example.com",
-            "shippingOptions": [{"shippingCost": {}}],  # No value key
-        }
-
-        product = adapter._parse_product(item)
-
-        assert product.shipping_cost is None
-        assert product.free_shipping is False
-
-    def test_parse_product_condition_mapping(self, adapter: EbayAdapter) -> None:
+    @pytest.mark.parametrize(
+        ("item_overrides", "attr", "expected"),
+        [
+            pytest.param(
+                {"seller": {"username": "test"}}, "seller_rating", None, id="no_seller_rating"
+            ),
+            pytest.param({}, "shipping_cost", None, id="no_shipping_cost"),
+            pytest.param({}, "free_shipping", False, id="no_shipping_free_shipping"),
+            pytest.param(
+                {"shippingOptions": [{"shippingCost": {}}]},
+                "shipping_cost",
+                None,
+                id="shipping_no_value_cost",
+            ),
+            pytest.param(
+                {"shippingOptions": [{"shippingCost": {}}]},
+                "free_shipping",
+                False,
+                id="shipping_no_value_free_shipping",
+            ),
+            pytest.param({}, "image_url", None, id="no_image"),
+            pytest.param({"image": {}}, "image_url", None, id="empty_image"),
+            pytest.param(
+                {"estimatedAvailabilities": [{"estimatedAvailableQuantity": 5}]},
+                "available_quantity",
+                5,
+                id="with_availability",
+            ),
+            pytest.param({}, "available_quantity", None, id="no_availability"),
+        ],
+    )
+    def test_parse_product_edge_cases(
+        self,
+        adapter: EbayAdapter,
+        item_overrides: dict[str, Any],
+        attr: str,
+        expected: object,
+    ) -> None:
+        """_parse_product should handle missing or partial optional fields."""
+        product = adapter._parse_product(_BASE_ITEM | item_overrides)
+
+        assert getattr(product, attr) == expected
+
+    @pytest.mark.parametrize(
+        ("ebay_condition", "expected"),
+        [
+            ("New", "new"),
+            ("New with tags", "new"),
+            ("Used", "used"),
+            ("Pre-owned", "used"),
+            ("Certified refurbished", "refurbished"),
+            ("Unknown", "new"),  # Default
+        ],
+    )
+    def test_parse_product_condition_mapping(
+        self, adapter: EbayAdapter, ebay_condition: str, expected: str
+    ) -> None:
         """_parse_product should map conditions correctly."""
-        conditions = {
-            "New": "new",
-            "New with tags": "new",
-            "Used": "used",
-            "Pre-owned": "used",
-            "Certified refurbished": "refurbished",
-            "Unknown": "new",  # Default
-        }
-
-        for ebay_condition, expected in conditions.items():
-            item = {
-                "itemId": "123",
-                "title": "Test",
-                "price": {"value": "100", "currency": "USD"},
-                "itemWebUrl": "https://example.com",
-                "condition": ebay_condition,
-            }
+        product = adapter._parse_product(_BASE_ITEM | {"condition": ebay_condition})
 
-            product = adapter._parse_product(item)
-
-            assert product.condition == expected
-
-    def test_parse_product_no_image(self, adapter: EbayAdapter) -> None:
-        """_parse_product should handle missing image."""
-        item = {
-            "itemId": "123",
-            "title": "Test",
-            "price": {"value": "100", "currency": "USD"},
-            "itemWebUrl": "https://example.com",
-        }
-
-        product = adapter._parse_product(item)
-
-        assert product.image_url is None
-
-    def test_parse_product_empty_image(self, adapter: EbayAdapter) -> None:
-        """_parse_product should handle empty image object."""
-        item = {
-            "itemId": "123",
-            "title": "Test",
-            "price": {"value": "100", "currency": "USD"},
-            "itemWebUrl": "https://example.com",
-            "image": {},
-        }
-
-        product = adapter._parse_product(item)
-
-        assert product.image_url is None
+        assert product.condition == expected
 
     def test_parse_product_with_item_href(self, adapter: EbayAdapter) -> None:
         """_parse_product should extract ID from itemHref if no itemId."""
@@ -499,53 +473,22 @@ class TestProductParsing:
 
         assert product.id == "v1|123|0"
 
-    def test_parse_product_with_availability(self, adapter: EbayAdapter) -> None:
-        """_parse_product should extract available quantity."""
-        item = {
-            "itemId": "123",
-            "title": "Test",
-            "price": {"value": "100", "currency": "USD"},
-            "itemWebUrl": "https://example.com",
-            "estimatedAvailabilities": [{"estimatedAvailableQuantity": 5}],
-        }
-
-        product = adapter._parse_product(item)
-
-        assert product.available_quantity == 5
-
-    def test_parse_product_no_availability(self, adapter: EbayAdapter) -> None:
-        """_parse_product should handle missing availability."""
-        item = {
-            "itemId": "123",
-            "title": "Test",
-            "price": {"value": "100", "currency": "USD"},
-            "itemWebUrl": "https://example.com",
-        }
-
-        product = adapter._parse_product(item)
-
-        assert product.available_quantity is None
-
 
 class TestSortOrderMapping:
     """Tests for sort order mapping."""
 
-    @pytest.fixture()
-    def adapter(self) -> EbayAdapter:
-        """Create adapter for testing."""
-        mock_client = AsyncMock(spec=EbayClient)
-        return EbayAdapter(app_id="test", cert_id="test", client=mock_client)
-
-    def test_map_all_sort_orders(self, adapter: EbayAdapter) -> None:
-        """_map_sort_order should map all SortOrder values."""
-        mappings = {
-            SortOrder.RELEVANCE: "BEST_MATCH",
-            SortOrder.PRICE_ASC: "price",
-            SortOrder.PRICE_DESC: "-price",
-            SortOrder.NEWEST: "newlyListed",
-            SortOrder.BEST_SELLER: "BEST_MATCH",  # No direct equivalent
-        }
-
-        for sort_order, expected in mappings.items():
-            result = adapter._map_sort_order(sort_order)
-            assert result == expected
+    @pytest.mark.parametrize(
+        ("sort_order", "expected"),
+        [
+            (SortOrder.RELEVANCE, "BEST_MATCH"),
+            (SortOrder.PRICE_ASC, "price"),
+            (SortOrder.PRICE_DESC, "-price"),
+            (SortOrder.NEWEST, "newlyListed"),
+            (SortOrder.BEST_SELLER, "BEST_MATCH"),  # No direct equivalent
+        ],
+    )
+    def test_map_sort_order(
+        self, adapter: EbayAdapter, sort_order: SortOrder, expected: str
+    ) -> None:
+        """_map_sort_order should map every SortOrder value."""
+        assert adapter._map_sort_order(sort_order) == expected
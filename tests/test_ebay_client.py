@@ -2,19 +2,63 @@
 
 from __future__ import annotations
 
-from datetime import UTC, datetime, timedelta
+import asyncio
+import math
+import time
+from typing import TYPE_CHECKING
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
 import pytest
+import pytest_asyncio
+import respx
 
 from core.result import Failure, Success
 from services.marketplaces.ebay.client import (
+    BROWSE_API_URL,
+    CONNECT_TIMEOUT,
     EBAY_MARKETPLACES,
+    POOL_LIMITS,
     EbayClient,
 )
 from services.marketplaces.errors import ErrorCode
 
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Iterator
+
+# Token deadlines on the monotonic clock that never expire / are always expired
+_FAR_FUTURE = math.inf
+_PAST = -math.inf
+
+
+@pytest.fixture(scope="module")
+def client() -> EbayClient:
+    """Create the client shared by the module."""
+    return EbayClient(app_id="test-app-id", cert_id="test-cert-id")
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def _reset_client(client: EbayClient) -> AsyncIterator[None]:
+    """Close the shared client and drop its token after each test."""
+    yield
+    await client.close()
+    client._access_token = None
+    client._token_expires_at = None
+
+
+@pytest.fixture(scope="module")
+def shared_http() -> AsyncMock:
+    """Create the HTTP client mock shared by the module."""
+    return AsyncMock()
+
+
+@pytest.fixture()
+def mock_http(client: EbayClient, shared_http: AsyncMock) -> Iterator[AsyncMock]:
+    """Route the client's HTTP calls to the shared mock, resetting it after the test."""
+    with patch.object(client, "_get_client", return_value=shared_http):
+        yield shared_http
+    shared_http.reset_mock(return_value=True, side_effect=True)
+
 
 class TestEbayMarketplaces:
     """Tests for EBAY_MARKETPLACES constant."""
@@ -80,11 +124,6 @@ class TestEbayClientInit:
 class TestEbayClientTokenManagement:
     """Tests for token management."""
 
-    @pytest.fixture()
-    def client(self) -> EbayClient:
-        """Create a client for testing."""
-        return EbayClient(app_id="test-app-id", cert_id="test-cert-id")
-
     def test_is_token_valid_no_token(self, client: EbayClient) -> None:
         """_is_token_valid should return False when no token."""
         assert client._is_token_valid() is False
@@ -92,14 +131,14 @@ class TestEbayClientTokenManagement:
     def test_is_token_valid_expired(self, client: EbayClient) -> None:
         """_is_token_valid should return False when token expired."""
         client._access_token = "test-token"
-        client._token_expires_at = datetime.now(UTC) - timedelta(hours=1)
+        client._token_expires_at = _PAST
 
         assert client._is_token_valid() is False
 
     def test_is_token_valid_valid(self, client: EbayClient) -> None:
         """_is_token_valid should return True when token valid."""
         client._access_token = "test-token"
-        client._token_expires_at = datetime.now(UTC) + timedelta(hours=1)
+        client._token_expires_at = _FAR_FUTURE
 
         assert client._is_token_valid() is True
 
@@ -107,7 +146,7 @@ class TestEbayClientTokenManagement:
         """_is_token_valid should return False when token near expiry."""
         client._access_token = "test-token"
         # Token expires in 30 seconds, but we have 60 second buffer
-        client._token_expires_at = datetime.now(UTC) + timedelta(seconds=30)
+        client._token_expires_at = time.monotonic() + 30
 
         assert client._is_token_valid() is False
 
@@ -115,16 +154,11 @@ class TestEbayClientTokenManagement:
 class TestEbayClientAuth:
     """Tests for OAuth authentication."""
 
-    @pytest.fixture()
-    def client(self) -> EbayClient:
-        """Create a client for testing."""
-        return EbayClient(app_id="test-app-id", cert_id="test-cert-id")
-
     @pytest.mark.asyncio
     async def test_get_access_token_returns_cached(self, client: EbayClient) -> None:
         """_get_access_token should return cached token if valid."""
         client._access_token = "cached-token"
-        client._token_expires_at = datetime.now(UTC) + timedelta(hours=1)
+        client._token_expires_at = _FAR_FUTURE
 
         result = await client._get_access_token()
 
@@ -132,7 +166,9 @@ class TestEbayClientAuth:
         assert result.value == "cached-token"
 
     @pytest.mark.asyncio
-    async def test_get_access_token_fetches_new(self, client: EbayClient) -> None:
+    async def test_get_access_token_fetches_new(
+        self, client: EbayClient, mock_http: AsyncMock
+    ) -> None:
         """_get_access_token should fetch new token when needed."""
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -141,331 +177,260 @@ class TestEbayClientAuth:
             "expires_in": 7200,
         }
 
-        with patch.object(client, "_get_client") as mock_get_client:
-            mock_http = AsyncMock()
-            mock_http.post.return_value = mock_response
-            mock_get_client.return_value = mock_http
+        mock_http.post.return_value = mock_response
 
-            result = await client._get_access_token()
-
-            assert isinstance(result, Success)
-            assert result.value == "new-token"
-            assert client._access_token == "new-token"
-
-    @pytest.mark.asyncio
-    async def test_get_access_token_auth_failure(self, client: EbayClient) -> None:
-        """_get_access_token should return AuthenticationError on 401."""
-        mock_response = MagicMock()
-        mock_response.status_code = 401
-
-        with patch.object(client, "_get_client") as mock_get_client:
-            mock_http = AsyncMock()
-            mock_http.post.return_value = mock_response
-            mock_get_client.return_value = mock_http
-
-            result = await client._get_access_token()
+        result = await client._get_access_token()
 
-            assert isinstance(result, Failure)
-            assert result.error.code == ErrorCode.AUTHENTICATION
+        assert isinstance(result, Success)
+        assert result.value == "new-token"
+        assert client._access_token == "new-token"
+        headers = mock_http.post.call_args.kwargs["headers"]
+        assert headers["Authorization"] == "Basic dGVzdC1hcHAtaWQ6dGVzdC1jZXJ0LWlk"
 
     @pytest.mark.asyncio
-    async def test_get_access_token_server_error(self, client: EbayClient) -> None:
-        """_get_access_token should return NetworkError on server error."""
-        mock_response = MagicMock()
-        mock_response.status_code = 500
-        mock_response.text = "Internal Server Error"
-
-        with patch.object(client, "_get_client") as mock_get_client:
-            mock_http = AsyncMock()
-            mock_http.post.return_value = mock_response
-            mock_get_client.return_value = mock_http
+    @pytest.mark.parametrize(
+        ("outcome", "expected_code"),
+        [
+            pytest.param(httpx.Response(401), ErrorCode.AUTHENTICATION, id="auth_failure"),
+            pytest.param(
+                httpx.Response(500, text="Internal Server Error"),
+                ErrorCode.NETWORK,
+                id="server_error",
+            ),
+            pytest.param(httpx.TimeoutException("Timeout"), ErrorCode.NETWORK, id="timeout"),
+            pytest.param(
+                httpx.RequestError("Connection failed"), ErrorCode.NETWORK, id="request_error"
+            ),
+            # A 200 without access_token is a malformed response.
+            pytest.param(
+                httpx.Response(200, json={"invalid": "response"}), ErrorCode.PARSE, id="parse_error"
+            ),
+        ],
+    )
+    async def test_get_access_token_errors(
+        self,
+        client: EbayClient,
+        mock_http: AsyncMock,
+        outcome: httpx.Response | Exception,
+        expected_code: ErrorCode,
+    ) -> None:
+        """_get_access_token should map each failed token request to its error code."""
+        mock_http.post.side_effect = [outcome]
 
-            result = await client._get_access_token()
+        result = await client._get_access_token()
 
-            assert isinstance(result, Failure)
-            assert result.error.code == ErrorCode.NETWORK
+        assert isinstance(result, Failure)
+        assert result.error.code == expected_code
 
-    @pytest.mark.asyncio
-    async def test_get_access_token_timeout(self, client: EbayClient) -> None:
-        """_get_access_token should return NetworkError on timeout."""
-        with patch.object(client, "_get_client") as mock_get_client:
-            mock_http = AsyncMock()
-            mock_http.post.side_effect = httpx.TimeoutException("Timeout")
-            mock_get_client.return_value = mock_http
 
-            result = await client._get_access_token()
+class TestEbayClientTokenSingleFlight:
+    """Tests for single-flight token fetches."""
 
-            assert isinstance(result, Failure)
-            assert result.error.code == ErrorCode.NETWORK
+    @pytest.fixture(autouse=True)
+    def _token_response(self, mock_http: AsyncMock) -> None:
+        """Answer token requests with a new token."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"access_token": "new-token", "expires_in": 7200}
+        mock_http.post.return_value = mock_response
 
     @pytest.mark.asyncio
-    async def test_get_access_token_request_error(self, client: EbayClient) -> None:
-        """_get_access_token should return NetworkError on request error."""
-        with patch.object(client, "_get_client") as mock_get_client:
-            mock_http = AsyncMock()
-            mock_http.post.side_effect = httpx.RequestError("Connection failed")
-            mock_get_client.return_value = mock_http
+    async def test_get_access_token_waits_for_in_flight_fetch(
+        self, client: EbayClient, mock_http: AsyncMock
+    ) -> None:
+        """_get_access_token should reuse a token fetched while it waited for the lock."""
+        async with client._token_lock:
+            waiter = asyncio.create_task(client._get_access_token())
+            await asyncio.sleep(0)
+            client._access_token = "fetched-meanwhile"
+            client._token_expires_at = _FAR_FUTURE
+
+        result = await waiter
 
-            result = await client._get_access_token()
-
-            assert isinstance(result, Failure)
-            assert result.error.code == ErrorCode.NETWORK
+        assert isinstance(result, Success)
+        assert result.value == "fetched-meanwhile"
+        mock_http.post.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_get_access_token_parse_error(self, client: EbayClient) -> None:
-        """_get_access_token should return ParseError on invalid response."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"invalid": "response"}  # Missing access_token
-
-        with patch.object(client, "_get_client") as mock_get_client:
-            mock_http = AsyncMock()
-            mock_http.post.return_value = mock_response
-            mock_get_client.return_value = mock_http
+    async def test_concurrent_get_access_token_single_flight(
+        self, client: EbayClient, mock_http: AsyncMock
+    ) -> None:
+        """Concurrent callers without a valid token should share one token fetch."""
+        results = await asyncio.gather(*(client._get_access_token() for _ in range(10)))
 
-            result = await client._get_access_token()
-
-            assert isinstance(result, Failure)
-            assert result.error.code == ErrorCode.PARSE
+        assert all(isinstance(r, Success) and r.value == "new-token" for r in results)
+        assert mock_http.post.call_count == 1
 
 
 class TestEbayClientSearch:
-    """Tests for search method."""
+    """Tests for search method, run against the real HTTP client through respx."""
 
-    @pytest.fixture()
-    def client(self) -> EbayClient:
-        """Create a client for testing."""
-        client = EbayClient(app_id="test-app-id", cert_id="test-cert-id")
+    @pytest.fixture(autouse=True)
+    def _valid_token(self, client: EbayClient) -> None:
+        """Give the client a cached token so requests skip the OAuth call."""
         client._access_token = "test-token"
-        client._token_expires_at = datetime.now(UTC) + timedelta(hours=1)
-        return client
+        client._token_expires_at = _FAR_FUTURE
+
+    @pytest_asyncio.fixture()
+    async def search_route(self) -> AsyncIterator[respx.Route]:
+        """Mock the Browse API search endpoint."""
+        with respx.mock(base_url=BROWSE_API_URL) as router:
+            yield router.get("/item_summary/search")
 
     @pytest.mark.asyncio
-    async def test_search_success(self, client: EbayClient) -> None:
+    async def test_search_success(self, client: EbayClient, search_route: respx.Route) -> None:
         """search should return Success with data."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "itemSummaries": [{"itemId": "123"}],
-            "total": 1,
-        }
-
-        with patch.object(client, "_get_client") as mock_get_client:
-            mock_http = AsyncMock()
-            mock_http.request.return_value = mock_response
-            mock_get_client.return_value = mock_http
+        search_route.respond(200, json={"itemSummaries": [{"itemId": "123"}], "total": 1})
 
-            result = await client.search(query="laptop")
+        result = await client.search(query="laptop")
 
-            assert isinstance(result, Success)
-            assert result.value["total"] == 1
+        assert isinstance(result, Success)
+        assert result.value["total"] == 1
+        request = search_route.calls.last.request
+        assert request.url.params["q"] == "laptop"
+        assert request.headers["Authorization"] == "Bearer test-token"
+        assert request.headers["X-EBAY-C-MARKETPLACE-ID"] == "EBAY_US"
 
     @pytest.mark.asyncio
-    async def test_search_with_price_filters(self, client: EbayClient) -> None:
+    async def test_search_with_price_filters(
+        self, client: EbayClient, search_route: respx.Route
+    ) -> None:
         """search should include price filters."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"itemSummaries": [], "total": 0}
-
-        with patch.object(client, "_get_client") as mock_get_client:
-            mock_http = AsyncMock()
-            mock_http.request.return_value = mock_response
-            mock_get_client.return_value = mock_http
+        search_route.respond(200, json={"itemSummaries": [], "total": 0})
 
-            await client.search(query="laptop", min_price=100, max_price=500)
+        await client.search(query="laptop", min_price=100, max_price=500)
 
-            call_args = mock_http.request.call_args
-            params = call_args.kwargs["params"]
-            assert "filter" in params
-            assert "100" in params["filter"]
-            assert "500" in params["filter"]
+        params = search_route.calls.last.request.url.params
+        assert "filter" in params
+        assert "100" in params["filter"]
+        assert "500" in params["filter"]
 
     @pytest.mark.asyncio
-    async def test_search_with_min_price_only(self, client: EbayClient) -> None:
+    async def test_search_with_min_price_only(
+        self, client: EbayClient, search_route: respx.Route
+    ) -> None:
         """search should handle min_price only."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"itemSummaries": [], "total": 0}
-
-        with patch.object(client, "_get_client") as mock_get_client:
-            mock_http = AsyncMock()
-            mock_http.request.return_value = mock_response
-            mock_get_client.return_value = mock_http
+        search_route.respond(200, json={"itemSummaries": [], "total": 0})
 
-            await client.search(query="laptop", min_price=100)
+        await client.search(query="laptop", min_price=100)
 
-            call_args = mock_http.request.call_args
-            params = call_args.kwargs["params"]
-            assert params["filter"] == "price:[100..]"
+        params = search_route.calls.last.request.url.params
+        assert params["filter"] == "price:[100..]"
 
     @pytest.mark.asyncio
-    async def test_search_with_max_price_only(self, client: EbayClient) -> None:
+    async def test_search_with_max_price_only(
+        self, client: EbayClient, search_route: respx.Route
+    ) -> None:
         """search should handle max_price only."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"itemSummaries": [], "total": 0}
+        search_route.respond(200, json={"itemSummaries": [], "total": 0})
 
-        with patch.object(client, "_get_client") as mock_get_client:
-            mock_http = AsyncMock()
-            mock_http.request.return_value = mock_response
-            mock_get_client.return_value = mock_http
+        await client.search(query="laptop", max_price=500)
 
-            await client.search(query="laptop", max_price=500)
-
-            call_args = mock_http.request.call_args
-            params = call_args.kwargs["params"]
-            assert params["filter"] == "price:[..500]"
+        params = search_route.calls.last.request.url.params
+        assert params["filter"] == "price:[..500]"
 
     @pytest.mark.asyncio
-    async def test_search_rate_limit(self, client: EbayClient) -> None:
-        """search should return RateLimitError on 429."""
-        mock_response = MagicMock()
-        mock_response.status_code = 429
-        mock_response.headers = {"Retry-After": "30"}
-
-        with patch.object(client, "_get_client") as mock_get_client:
-            mock_http = AsyncMock()
-            mock_http.request.return_value = mock_response
-            mock_get_client.return_value = mock_http
-
-            result = await client.search(query="laptop")
-
-            assert isinstance(result, Failure)
-            assert result.error.code == ErrorCode.RATE_LIMIT
-            assert result.error.retry_after == 30
+    @pytest.mark.parametrize(
+        ("headers", "expected_retry_after"),
+        [
+            pytest.param({"Retry-After": "30"}, 30, id="retry_after_header"),
+            # Without Retry-After the client backs off for a minute.
+            pytest.param({}, 60, id="default"),
+        ],
+    )
+    async def test_search_rate_limit(
+        self,
+        client: EbayClient,
+        search_route: respx.Route,
+        headers: dict[str, str],
+        expected_retry_after: int,
+    ) -> None:
+        """search should return RateLimitError with the server's backoff on 429."""
+        search_route.respond(429, headers=headers)
+
+        result = await client.search(query="laptop")
+
+        assert isinstance(result, Failure)
+        assert result.error.code == ErrorCode.RATE_LIMIT
+        assert result.error.retry_after == expected_retry_after
 
     @pytest.mark.asyncio
-    async def test_search_rate_limit_no_header(self, client: EbayClient) -> None:
-        """search should default to 60s when no Retry-After header."""
-        mock_response = MagicMock()
-        mock_response.status_code = 429
-        mock_response.headers = {}
-
-        with patch.object(client, "_get_client") as mock_get_client:
-            mock_http = AsyncMock()
-            mock_http.request.return_value = mock_response
-            mock_get_client.return_value = mock_http
-
-            result = await client.search(query="laptop")
-
-            assert isinstance(result, Failure)
-            assert result.error.retry_after == 60
-
-    @pytest.mark.asyncio
-    async def test_search_auth_error_invalidates_token(self, client: EbayClient) -> None:
+    async def test_search_auth_error_invalidates_token(
+        self, client: EbayClient, search_route: respx.Route
+    ) -> None:
         """search should invalidate token on 401."""
-        mock_response = MagicMock()
-        mock_response.status_code = 401
-
-        with patch.object(client, "_get_client") as mock_get_client:
-            mock_http = AsyncMock()
-            mock_http.request.return_value = mock_response
-            mock_get_client.return_value = mock_http
+        search_route.respond(401)
 
-            result = await client.search(query="laptop")
+        result = await client.search(query="laptop")
 
-            assert isinstance(result, Failure)
-            assert result.error.code == ErrorCode.AUTHENTICATION
-            assert client._access_token is None
+        assert isinstance(result, Failure)
+        assert result.error.code == ErrorCode.AUTHENTICATION
+        assert client._access_token is None
 
     @pytest.mark.asyncio
-    async def test_search_api_error(self, client: EbayClient) -> None:
-        """search should return NetworkError on API error."""
-        mock_response = MagicMock()
-        mock_response.status_code = 500
-        mock_response.text = "Internal Server Error"
-
-        with patch.object(client, "_get_client") as mock_get_client:
-            mock_http = AsyncMock()
-            mock_http.request.return_value = mock_response
-            mock_get_client.return_value = mock_http
-
-            result = await client.search(query="laptop")
-
-            assert isinstance(result, Failure)
-            assert result.error.code == ErrorCode.NETWORK
-
-    @pytest.mark.asyncio
-    async def test_search_parse_error(self, client: EbayClient) -> None:
-        """search should return ParseError on invalid JSON."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.side_effect = ValueError("Invalid JSON")
-
-        with patch.object(client, "_get_client") as mock_get_client:
-            mock_http = AsyncMock()
-            mock_http.request.return_value = mock_response
-            mock_get_client.return_value = mock_http
-
-            result = await client.search(query="laptop")
-
-            assert isinstance(result, Failure)
-            assert result.error.code == ErrorCode.PARSE
-
-    @pytest.mark.asyncio
-    async def test_search_timeout(self, client: EbayClient) -> None:
-        """search should return NetworkError on timeout."""
-        with patch.object(client, "_get_client") as mock_get_client:
-            mock_http = AsyncMock()
-            mock_http.request.side_effect = httpx.TimeoutException("Timeout")
-            mock_get_client.return_value = mock_http
-
-            result = await client.search(query="laptop")
-
-            assert isinstance(result, Failure)
-            assert result.error.code == ErrorCode.NETWORK
-
-    @pytest.mark.asyncio
-    async def test_search_request_error(self, client: EbayClient) -> None:
-        """search should return NetworkError on request error."""
-        with patch.object(client, "_get_client") as mock_get_client:
-            mock_http = AsyncMock()
-            mock_http.request.side_effect = httpx.RequestError("Connection failed")
-            mock_get_client.return_value = mock_http
-
-            result = await client.search(query="laptop")
-
-            assert isinstance(result, Failure)
-            assert result.error.code == ErrorCode.NETWORK
+    @pytest.mark.parametrize(
+        ("outcome", "expected_code"),
+        [
+            pytest.param(
+                httpx.Response(500, text="Internal Server Error"),
+                ErrorCode.NETWORK,
+                id="api_error",
+            ),
+            pytest.param(
+                httpx.Response(200, text="Invalid JSON"), ErrorCode.PARSE, id="parse_error"
+            ),
+            pytest.param(httpx.ReadTimeout("Timeout"), ErrorCode.NETWORK, id="timeout"),
+            pytest.param(
+                httpx.ConnectError("Connection failed"), ErrorCode.NETWORK, id="request_error"
+            ),
+        ],
+    )
+    async def test_search_errors(
+        self,
+        client: EbayClient,
+        search_route: respx.Route,
+        outcome: httpx.Response | Exception,
+        expected_code: ErrorCode,
+    ) -> None:
+        """search should map each failed API request to its error code."""
+        search_route.side_effect = [outcome]
+
+        result = await client.search(query="laptop")
+
+        assert isinstance(result, Failure)
+        assert result.error.code == expected_code
 
 
 class TestEbayClientGetItem:
     """Tests for get_item method."""
 
-    @pytest.fixture()
-    def client(self) -> EbayClient:
-        """Create a client for testing."""
-        client = EbayClient(app_id="test-app-id", cert_id="test-cert-id")
+    @pytest.fixture(autouse=True)
+    def _valid_token(self, client: EbayClient) -> None:
+        """Give the client a cached token so requests skip the OAuth call."""
         client._access_token = "test-token"
-        client._token_expires_at = datetime.now(UTC) + timedelta(hours=1)
-        return client
+        client._token_expires_at = _FAR_FUTURE
 
     @pytest.mark.asyncio
-    async def test_get_item_success(self, client: EbayClient) -> None:
+    async def test_get_item_success(self, client: EbayClient, mock_http: AsyncMock) -> None:
         """get_item should return Success with item data."""
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.json.return_value = {"itemId": "123", "title": "Test Item"}
 
-        with patch.object(client, "_get_client") as mock_get_client:
-            mock_http = AsyncMock()
-            mock_http.request.return_value = mock_response
-            mock_get_client.return_value = mock_http
+        mock_http.request.return_value = mock_response
 
-            result = await client.get_item("123")
+        result = await client.get_item("123")
 
-            assert isinstance(result, Success)
-            assert result.value["itemId"] == "123"
+        assert isinstance(result, Success)
+        assert result.value["itemId"] == "123"
 
 
 class TestEbayClientHealthcheck:
     """Tests for healthcheck method."""
 
     @pytest.mark.asyncio
-    async def test_healthcheck_success(self) -> None:
+    async def test_healthcheck_success(self, client: EbayClient, mock_http: AsyncMock) -> None:
         """healthcheck should return True when auth succeeds."""
-        client = EbayClient(app_id="test-app-id", cert_id="test-cert-id")
-
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.json.return_value = {
@@ -473,34 +438,37 @@ class TestEbayClientHealthcheck:
             "expires_in": 7200,
         }
 
-        with patch.object(client, "_get_client") as mock_get_client:
-            mock_http = AsyncMock()
-            mock_http.post.return_value = mock_response
-            mock_get_client.return_value = mock_http
+        mock_http.post.return_value = mock_response
 
-            result = await client.healthcheck()
+        result = await client.healthcheck()
 
-            assert result is True
+        assert result is True
 
     @pytest.mark.asyncio
-    async def test_healthcheck_failure(self) -> None:
-        """healthcheck should return False when auth fails."""
-        client = EbayClient(app_id="test-app-id", cert_id="test-cert-id")
+    async def test_healthcheck_uses_cached_token(
+        self, client: EbayClient, mock_http: AsyncMock
+    ) -> None:
+        """healthcheck should not call the token endpoint while the cached token is valid."""
+        client._access_token = "cached-token"
+        client._token_expires_at = _FAR_FUTURE
 
-        with patch.object(client, "_get_client") as mock_get_client:
-            mock_http = AsyncMock()
-            mock_http.post.side_effect = httpx.RequestError("Connection failed")
-            mock_get_client.return_value = mock_http
+        result = await client.healthcheck()
 
-            result = await client.healthcheck()
+        assert result is True
+        mock_http.post.assert_not_called()
 
-            assert result is False
+    @pytest.mark.asyncio
+    async def test_healthcheck_failure(self, client: EbayClient, mock_http: AsyncMock) -> None:
+        """healthcheck should return False when auth fails."""
+        mock_http.post.side_effect = httpx.RequestError("Connection failed")
+
+        result = await client.healthcheck()
+
+        assert result is False
 
     @pytest.mark.asyncio
-    async def test_healthcheck_exception(self) -> None:
+    async def test_healthcheck_exception(self, client: EbayClient) -> None:
         """healthcheck should return False on any exception."""
-        client = EbayClient(app_id="test-app-id", cert_id="test-cert-id")
-
         with patch.object(client, "_get_access_token") as mock_get_token:
             mock_get_token.side_effect = Exception("Unexpected error")
 
@@ -524,6 +492,19 @@ class TestEbayClientLifecycle:
         assert isinstance(http_client, httpx.AsyncClient)
         await client.close()
 
+    @pytest.mark.asyncio
+    async def test_get_client_uses_pool_limits(self) -> None:
+        """_get_client should configure keep-alive pooling and a short connect timeout."""
+        client = EbayClient(app_id="test-app-id", cert_id="test-cert-id", timeout=10.0)
+
+        with patch("httpx.AsyncClient") as async_client:
+            http_client = await client._get_client()
+
+        assert http_client is async_client.return_value
+        kwargs = async_client.call_args.kwargs
+        assert kwargs["limits"] is POOL_LIMITS
+        assert kwargs["timeout"] == httpx.Timeout(10.0, connect=CONNECT_TIMEOUT)
+
     @pytest.mark.asyncio
     async def test_get_client_recreates_closed_client(self) -> None:
         """_get_client should recreate client when closed."""
@@ -555,6 +536,29 @@ class TestEbayClientLifecycle:
         assert first_client is second_client
         await client.close()
 
+    @pytest.mark.asyncio
+    async def test_client_context_manager_reuses_pool(self) -> None:
+        """async with should share one HTTP client across requests and close it on exit."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"itemSummaries": [], "total": 0}
+
+        async with EbayClient(app_id="test-app-id", cert_id="test-cert-id") as client:
+            client._access_token = "test-token"
+            client._token_expires_at = _FAR_FUTURE
+            http_client = client._client
+            assert http_client is not None
+
+            with patch.object(http_client, "request", return_value=mock_response) as request:
+                await client.search(query="laptop")
+                await client.search(query="laptop")
+
+            assert request.call_count == 2
+            assert client._client is http_client
+
+        assert http_client.is_closed
+        assert client._client is None
+
     @pytest.mark.asyncio
     async def test_close_closes_client(self) -> None:
         """close should close the HTTP client."""
@@ -579,16 +583,13 @@ class TestEbayClientAuthWithNoToken:
     """Test _make_request when token fetch fails."""
 
     @pytest.mark.asyncio
-    async def test_make_request_fails_when_token_fails(self) -> None:
+    async def test_make_request_fails_when_token_fails(
+        self, client: EbayClient, mock_http: AsyncMock
+    ) -> None:
         """_make_request should return failure when token fetch fails."""
-        client = EbayClient(app_id="test-app-id", cert_id="test-cert-id")
-
-        with patch.object(client, "_get_client") as mock_get_client:
-            mock_http = AsyncMock()
-            mock_http.post.side_effect = httpx.RequestError("Connection failed")
-            mock_get_client.return_value = mock_http
+        mock_http.post.side_effect = httpx.RequestError("Connection failed")
 
-            result = await client.search(query="laptop")
+        result = await client.search(query="laptop")
 
-            assert isinstance(result, Failure)
-            assert result.error.code == ErrorCode.NETWORK
+        assert isinstance(result, Failure)
+        assert result.error.code == ErrorCode.NETWORK
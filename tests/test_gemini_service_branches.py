@@ -73,18 +73,21 @@ class TestBuildSearchIntentSortCriteria:
 class TestGenerateTitle:
     """Tests for the ``generate_title`` method."""
 
+    @pytest.mark.asyncio
     async def test_empty_message_returns_default(self, service: GeminiService) -> None:
         """generate_title should return the default title for empty message."""
         result = await service.generate_title("")
 
         assert result == "New conversation"
 
+    @pytest.mark.asyncio
     async def test_whitespace_message_returns_default(self, service: GeminiService) -> None:
         """generate_title should return the default title for whitespace message."""
         result = await service.generate_title("   ")
 
         assert result == "New conversation"
 
+    @pytest.mark.asyncio
     async def test_success_returns_stripped_title(self, service: GeminiService) -> None:
         """generate_title should return the AI-generated title, stripped and truncated."""
         mock_response = MagicMock()
@@ -97,6 +100,7 @@ class TestGenerateTitle:
 
         assert result == "Gaming Laptops"
 
+    @pytest.mark.asyncio
     async def test_blank_ai_text_returns_default(self, service: GeminiService) -> None:
         """generate_title should return the default when the AI text is only whitespace."""
         mock_response = MagicMock()
@@ -109,6 +113,7 @@ class TestGenerateTitle:
 
         assert result == "New conversation"
 
+    @pytest.mark.asyncio
     async def test_empty_ai_text_returns_default(self, service: GeminiService) -> None:
         """generate_title should return the default when the AI text is empty."""
         mock_response = MagicMock()
@@ -121,6 +126,7 @@ class TestGenerateTitle:
 
         assert result == "New conversation"
 
+    @pytest.mark.asyncio
     async def test_error_short_message_falls_back_to_message(self, service: GeminiService) -> None:
         """On error, a short message should be returned verbatim as the fallback title."""
         mock_client = MagicMock()
@@ -131,6 +137,7 @@ class TestGenerateTitle:
 
         assert result == "laptop"
 
+    @pytest.mark.asyncio
     async def test_error_long_message_falls_back_to_truncated(self, service: GeminiService) -> None:
         """On error, a long message should be truncated to 30 chars as the fallback title."""
         long_message = "a" * 50
@@ -146,6 +153,7 @@ class TestGenerateTitle:
 class TestGenerateResponse:
     """Tests for the ``generate_response`` method."""
 
+    @pytest.mark.asyncio
     async def test_success_returns_stripped_text(self, service: GeminiService) -> None:
         """generate_response should return the AI text, stripped."""
         mock_response = MagicMock()
@@ -158,6 +166,7 @@ class TestGenerateResponse:
 
         assert result == "Found some great deals!"
 
+    @pytest.mark.asyncio
     async def test_empty_ai_text_returns_fallback(self, service: GeminiService) -> None:
         """generate_response should return the fallback when the AI text is empty."""
         mock_response = MagicMock()
@@ -176,6 +185,7 @@ class TestGenerateResponse:
 
         assert result == "Found 3 products for 'laptop'."
 
+    @pytest.mark.asyncio
     async def test_error_returns_fallback(self, service: GeminiService) -> None:
         """generate_response should return the fallback on API error."""
         mock_client = MagicMock()
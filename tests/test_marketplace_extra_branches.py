@@ -11,7 +11,7 @@ Covers two otherwise-unreached branches:
 
 from __future__ import annotations
 
-from datetime import UTC, datetime, timedelta
+import time
 from decimal import Decimal
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -32,7 +32,7 @@ class TestEbaySearchCategoryFilter:
         """A provided category_id is sent as the category_ids parameter."""
         client = EbayClient(app_id="test-app-id", cert_id="test-cert-id")
         client._access_token = "test-token"
-        client._token_expires_at = datetime.now(UTC) + timedelta(hours=1)
+        client._token_expires_at = time.monotonic() + 3600
 
         mock_response = MagicMock()
         mock_response.status_code = 200
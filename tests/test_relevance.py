@@ -48,12 +48,14 @@ def make_gemini_client(text: str) -> MagicMock:
 class TestFilterRelevantProductsAsync:
     """Tests for the filter_relevant_products_async entry point."""
 
+    @pytest.mark.asyncio
     async def test_empty_products_returned_as_is(self) -> None:
         """An empty product list short-circuits and is returned unchanged."""
         result = await filter_relevant_products_async([], "switch", "switch 2")
 
         assert result == []
 
+    @pytest.mark.asyncio
     async def test_no_client_uses_basic_filter(self) -> None:
         """Without a Gemini client, basic heuristic filtering is used."""
         products = [make_enriched("Nintendo Switch 2 Console New", "399")]
@@ -67,6 +69,7 @@ class TestFilterRelevantProductsAsync:
         assert len(result) == 1
         assert "Nintendo" in result[0].product.title
 
+    @pytest.mark.asyncio
     async def test_with_client_uses_ai_filter(self) -> None:
         """A Gemini client routes filtering through the AI classifier."""
         products = [make_enriched("Nintendo Switch Console", "399")]
@@ -82,6 +85,7 @@ class TestFilterRelevantProductsAsync:
         assert len(result) == 1
         assert client.models.generate_content.called
 
+    @pytest.mark.asyncio
     async def test_ai_exception_falls_back_to_basic(self) -> None:
         """When the AI classifier raises, basic filtering is used instead."""
         products = [make_enriched("Nintendo Switch 2 Console New", "399")]
@@ -102,6 +106,7 @@ class TestFilterRelevantProductsAsync:
 class TestFilterWithAI:
     """Tests for the _filter_with_ai classifier."""
 
+    @pytest.mark.asyncio
     async def test_empty_response_returns_products(self) -> None:
         """An empty AI response returns the products unchanged."""
         products = [make_enriched("Nintendo Switch", "399")]
@@ -111,6 +116,7 @@ class TestFilterWithAI:
 
         assert result == products
 
+    @pytest.mark.asyncio
     async def test_invalid_json_returns_products(self) -> None:
         """Unparseable AI output returns the products unchanged."""
         products = [make_enriched("Nintendo Switch", "399")]
@@ -121,6 +127,7 @@ class TestFilterWithAI:
 
         assert result == products
 
+    @pytest.mark.asyncio
     async def test_strips_json_code_fence(self) -> None:
         """A ```json fenced response is parsed correctly."""
         products = [make_enriched("Nintendo Switch", "399")]
@@ -130,6 +137,7 @@ class TestFilterWithAI:
 
         assert len(result) == 1
 
+    @pytest.mark.asyncio
     async def test_strips_plain_code_fence(self) -> None:
         """A plain ``` fenced response is parsed correctly."""
         products = [make_enriched("Nintendo Switch", "399")]
@@ -139,6 +147,7 @@ class TestFilterWithAI:
 
         assert len(result) == 1
 
+    @pytest.mark.asyncio
     async def test_valid_classifications_kept(self) -> None:
         """Products flagged physical and matching are kept (default matches=True)."""
         products = [
@@ -154,6 +163,7 @@ class TestFilterWithAI:
 
         assert len(result) == 2
 
+    @pytest.mark.asyncio
     async def test_relaxes_to_physical_only(self) -> None:
         """Few matches but more physical items relaxes to physical-only filter."""
         products = [
@@ -175,6 +185,7 @@ class TestFilterWithAI:
         titles = [p.product.title for p in result]
         assert titles == ["Nintendo Switch", "Switch Case"]
 
+    @pytest.mark.asyncio
     async def test_all_filtered_returns_top_five(self) -> None:
         """When nothing survives filtering, the top products are returned."""
         products = [